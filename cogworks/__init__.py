@@ -1,4 +1,5 @@
 from .engine import Engine
 from .component import Component
 from .game_object import GameObject
+from .prefab import Prefab
 from .scene_manager import SceneManager
\ No newline at end of file
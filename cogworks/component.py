@@ -1,9 +1,68 @@
+import math
+
+import pygame
+
+PHASES = ("update", "fixed_update", "render")
+
+# Component class -> phases it overrides with real work, filled on first use
+_overridden_phases: dict[type, frozenset[str]] = {}
+
+# Mutable field types that Component.clone copies one level deep (all have .copy()); everything else is shared
+_COPIED_TYPES = frozenset((list, dict, set, pygame.Rect))
+
+# Component class -> names of its __slots__ fields (across the MRO), filled on first use
+_slot_fields: dict[type, tuple[str, ...]] = {}
+
+
+def slot_fields(cls: type) -> tuple[str, ...]:
+    """Return the names of all __slots__ fields declared by a class and its bases."""
+    fields = _slot_fields.get(cls)
+    if fields is None:
+        names = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get("__slots__", ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name not in ("__dict__", "__weakref__") and name not in names:
+                    names.append(name)
+        fields = _slot_fields[cls] = tuple(names)
+    return fields
+
+
+# World-space (left, top, right, bottom) box for renderables whose extent is unknown; never culled
+UNBOUNDED_AABB = (-math.inf, -math.inf, math.inf, math.inf)
+
+
+def default_phase(method):
+    """
+    Mark a lifecycle method as a no-op default.
+    GameObjects leave a component out of a phase's dispatch list while that phase is still a default.
+    """
+    method.is_default_phase = True
+    return method
+
+
 class Component:
     """
     Base class for all components.
     Components add specific behaviour to GameObjects (e.g., rendering, physics, input).
+
+    Core state lives in __slots__ to keep per-component memory small. Subclasses that
+    do not declare their own __slots__ still get a regular __dict__.
     """
 
+    __slots__ = ("game_object", "active", "is_runtime", "has_started", "_debug", "__weakref__")
+
+    # Phases whose override only does work while `debug` is enabled (e.g. debug-only rendering)
+    debug_phases: tuple[str, ...] = ()
+
+    # True if render() only submits blits to the scene's RenderQueue while the scene renders.
+    # Other components draw directly, so the scene flushes the queue before calling them.
+    queued_render: bool = False
+
+    # True if get_static_blits() describes everything render() draws, so that on static
+    # GameObjects the component can be baked into a StaticLayer instead of rendering each frame
+    bakeable: bool = False
+
     def __init__(self):
         """
         Initialise a new Component.
@@ -13,6 +72,35 @@ class Component:
         self.active = True
         self.is_runtime = False
         self.has_started = False
+        self._debug = False
+
+    @property
+    def debug(self) -> bool:
+        """Whether debug visuals are enabled for this component."""
+        return self._debug
+
+    @debug.setter
+    def debug(self, value: bool) -> None:
+        self._debug = value
+        if self.game_object is not None:
+            self.game_object._refresh_dispatch()
+
+    def handles_phase(self, phase: str) -> bool:
+        """
+        Return True if this component does per-frame work in the given phase.
+
+        Args:
+            phase (str): One of "update", "fixed_update" or "render".
+        """
+        cls = type(self)
+        overridden = _overridden_phases.get(cls)
+        if overridden is None:
+            overridden = _overridden_phases[cls] = frozenset(
+                p for p in PHASES if not getattr(getattr(cls, p), "is_default_phase", False)
+            )
+        if phase not in overridden:
+            return False
+        return self._debug or phase not in cls.debug_phases
 
     def start(self) -> None:
         """
@@ -22,6 +110,7 @@ class Component:
         """
         pass
 
+    @default_phase
     def update(self, dt: float) -> None:
         """
         Called every frame to update the component.
@@ -31,6 +120,7 @@ class Component:
         """
         pass
 
+    @default_phase
     def fixed_update(self, dt: float) -> None:
         """
         Called at a fixed timestep for deterministic updates,
@@ -41,6 +131,7 @@ class Component:
         """
         pass
 
+    @default_phase
     def render(self, surface) -> None:
         """
         Called every frame to render visuals for this component.
@@ -50,6 +141,61 @@ class Component:
         """
         pass
 
+    def get_world_aabb(self) -> tuple[float, float, float, float] | None:
+        """
+        Return the world-space box (left, top, right, bottom) this component draws into,
+        or None if it draws nothing. Components that render without overriding this are
+        treated as unbounded, so they are never culled.
+        Overrides must call game_object._invalidate_aabb() when their extent changes other
+        than through the Transform.
+        """
+        return UNBOUNDED_AABB if self.handles_phase("render") else None
+
+    def get_static_blits(self, zoom: float) -> list[tuple[pygame.Surface, tuple[float, float], int]]:
+        """
+        Return what this component draws, for baking into a StaticLayer.
+        Only called on components with `bakeable` set.
+
+        Args:
+            zoom (float): Camera zoom to draw at.
+
+        Returns:
+            list[tuple[pygame.Surface, tuple[float, float], int]]: (image, top-left, alpha) blits, with
+            positions in world coordinates multiplied by the zoom. Images are not modified.
+        """
+        return []
+
+    def clone(self, cls: type | None = None) -> "Component":
+        """
+        Return an unattached, unstarted copy of this component.
+
+        Fields are copied one level deep: lists, dicts, sets and rects get their own copy,
+        while everything else (surfaces, fonts, sounds, animation definitions) is shared.
+        Override to reset per-instance state that must not be shared, such as physics bodies.
+
+        Args:
+            cls (type | None): Class of the copy. Defaults to the component's own class.
+        """
+        cls = cls or type(self)
+        clone = cls.__new__(cls)
+        copied_types = _COPIED_TYPES
+        for name in slot_fields(cls):
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+            setattr(clone, name, value.copy() if value.__class__ in copied_types else value)
+        fields = getattr(self, "__dict__", None)
+        if fields:
+            clone_fields = fields.copy()
+            for name, value in fields.items():
+                if value.__class__ in copied_types:
+                    clone_fields[name] = value.copy()
+            clone.__dict__ = clone_fields
+        clone.game_object = None
+        clone.has_started = False
+        return clone
+
     def on_remove(self) -> None:
         """
         Called when the component is removed from its GameObject.
@@ -17,6 +17,8 @@ class AudioListener(Component):
     (typically tied to the camera), and handles registration and cleanup.
     """
 
+    debug_phases = ("render",)
+
     def __init__(self, target_transform=None):
         """
         Args:
@@ -51,6 +51,13 @@ class AudioSource(Component):
             self.set_clip(self.clip_path)
 
 
+    def clone(self, cls: type | None = None) -> "AudioSource":
+        """Return an unattached copy sharing the loaded clip, without a playing channel or listener."""
+        clone = super().clone(cls)
+        clone.channel = None
+        clone._listener = None
+        return clone
+
     def start(self) -> None:
         if not pygame.mixer.get_init():
             pygame.mixer.init()
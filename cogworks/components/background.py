@@ -46,8 +46,11 @@ class Background(Component):
         new_width = int(img_width * scale)
         new_height = int(img_height * scale)
 
-        # Scale the image
-        self.scaled_image = pygame.transform.smoothscale(self.original_image, (new_width, new_height))
+        # Scale the image; smoothing would blend a colour key into the edges, so keyed images go through alpha
+        source = self.original_image
+        if source.get_colorkey() is not None or source.get_bitsize() < 24:
+            source = source.convert_alpha()
+        self.scaled_image = pygame.transform.smoothscale(source, (new_width, new_height))
 
         # Center the image
         self.transform.local_x = (screen_width - new_width) // 2
@@ -17,6 +17,19 @@ class Camera(Component):
         self.offset_y: float = 0
         self.zoom: float = 1.0  # 1.0 = normal, <1.0 = zoom out, >1.0 = zoom in
 
+        # Window size cached by begin_frame(), and the bounds last computed from it
+        self._view_size: tuple[int, int] | None = None
+        self._bounds: tuple[float, float, float, float] | None = None
+        self._bounds_key: tuple | None = None
+
+    def begin_frame(self) -> None:
+        """
+        Cache the window size for the current frame, so bounds and visibility checks
+        made during the frame do not query the window each time.
+        """
+        self._view_size = Window.get_instance().get_size()
+        self._bounds_key = None
+
     def move(self, dx: float, dy: float) -> None:
         """
         Move the camera by the specified deltas in world space.
@@ -179,14 +192,26 @@ class Camera(Component):
     def get_bounds(self) -> tuple[float, float, float, float]:
         """
         Get the current camera bounds in world coordinates.
+        After begin_frame() the result is cached until the camera moves or zooms.
 
         Returns:
             tuple[float, float, float, float]: The (top, bottom, left, right)
             coordinates of the camera’s visible region.
         """
-        w, h = Window.get_instance().get_size()
+        if self._view_size is None:
+            w, h = Window.get_instance().get_size()
+        else:
+            key = (self.offset_x, self.offset_y, self.zoom)
+            if key == self._bounds_key:
+                return self._bounds
+            w, h = self._view_size
+
         left = self.offset_x
         top = self.offset_y
         right = self.offset_x + w / self.zoom
         bottom = self.offset_y + h / self.zoom
+
+        if self._view_size is not None:
+            self._bounds = (top, bottom, left, right)
+            self._bounds_key = key
         return top, bottom, left, right
@@ -16,6 +16,8 @@ class Rigidbody2D(Component):
        Integrates with Pymunk physics for 2D simulations.
    """
 
+    debug_phases = ("render",)
+
     def __init__(
             self,
             shape_type: str = "box",
@@ -67,6 +69,17 @@ class Rigidbody2D(Component):
         self.shape: pymunk.Shape | None = None
         self.is_grounded: bool = False
         self.desired_velocity: Tuple[float, float] = (0, 0)
+        # (body position, body angle, transform position version, transform rotation version) after the last sync
+        self._synced_pose: tuple | None = None
+
+    def clone(self, cls: type | None = None) -> "Rigidbody2D":
+        """Return an unattached copy without a physics body; a new body is created when it starts."""
+        clone = super().clone(cls)
+        clone.body = None
+        clone.shape = None
+        clone.is_grounded = False
+        clone._synced_pose = None
+        return clone
 
     def start(self) -> None:
         """Initialises the Rigidbody2D component by linking it to the Transform and creating the physics body."""
@@ -209,8 +222,13 @@ class Rigidbody2D(Component):
             self.body.velocity = movement
 
         if not self.static:
-            self.transform.set_world_position(*self.body.position)
-            self.transform.set_local_rotation(-math.degrees(self.body.angle))
+            # Skip the sync while neither the body nor the transform has moved since the last one
+            body, transform = self.body, self.transform
+            pose = (body.position, body.angle, transform.position_version, transform.rotation_version)
+            if pose != self._synced_pose:
+                transform.set_world_position(*body.position)
+                transform.set_local_rotation(-math.degrees(body.angle))
+                self._synced_pose = (body.position, body.angle, transform.position_version, transform.rotation_version)
 
     def on_disabled(self) -> None:
         """Removes the body/shape from the physics space but keeps them for later re-enable."""
@@ -252,17 +270,18 @@ class Rigidbody2D(Component):
             self.body = pymunk.Body(safe_mass, moment)
             self.body.velocity_func = self._limit_velocity
 
-        self.body.position = self.transform.get_local_position()
-        self.body.angle = -math.radians(self.transform.local_rotation)
+        self.body.position = self.transform.get_world_position()
+        self.body.angle = -self.transform.get_world_rotation(radians=True)
         self.transform._rb_body = self.body
+        self._synced_pose = None
 
         if self.shape_type == "box":
             if self.static:
                 self.body = pymunk.Body(body_type=pymunk.Body.STATIC)
-                self.body.position = self.transform.get_local_position()
+                self.body.position = self.transform.get_world_position()
 
                 hw, hh = width / 2, height / 2
-                angle = -math.radians(self.transform.local_rotation)
+                angle = -self.transform.get_world_rotation(radians=True)
 
                 # Rotate vertices around origin
                 verts = [
@@ -280,7 +299,7 @@ class Rigidbody2D(Component):
         self.shape.friction = self.friction
         self.shape.elasticity = self.elasticity
 
-        self.game_object.scene.physics_space.add(self.body, self.shape)
+        self.game_object.scene.add_physics_objects(self.body, self.shape)
 
     def apply_force(self, fx, fy) -> None:
         """
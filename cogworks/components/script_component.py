@@ -1,4 +1,4 @@
-from cogworks.component import Component
+from cogworks.component import Component, default_phase
 
 
 class ScriptComponent(Component):
@@ -16,6 +16,7 @@ class ScriptComponent(Component):
         """
         super().start()
 
+    @default_phase
     def update(self, dt: float) -> None:
         """
         Called every frame to update the component.
@@ -23,6 +24,7 @@ class ScriptComponent(Component):
         """
         super().update(dt)
 
+    @default_phase
     def fixed_update(self, dt: float) -> None:
         """
         Called at a fixed timestep for deterministic updates
@@ -31,6 +33,7 @@ class ScriptComponent(Component):
         """
         super().fixed_update(dt)
 
+    @default_phase
     def render(self, surface) -> None:
         """
         Called every frame to render visuals for this component.
@@ -2,31 +2,41 @@ import pygame
 from cogworks.component import Component
 from cogworks.components.transform import Transform
 from cogworks.components.rigidbody2d import Rigidbody2D
-from cogworks.utils.asset_loader import load_user_image
+from cogworks.utils.asset_loader import apply_alpha, image_cache, load_user_image
+from cogworks.utils.rotation_cache import rotation_cache, transform_image
+from cogworks.utils.sprite_sheet import SpriteSheet
+from cogworks.utils.zoom_cache import zoom_cache
 
 
 class Sprite(Component):
     """
     Sprite component for rendering images attached to a GameObject with support
     for scaling, rotation, flipping, pixel-art mode, transparency, and camera visibility.
+    While its scene renders, sprites submit their blits to the scene's RenderQueue.
     """
 
+    queued_render = True
+    bakeable = True
+
     def __init__(
         self,
-        image_path: str,
+        image_path: str | None = None,
         offset_x: float = 0,
         offset_y: float = 0,
         scale_factor: float = 1.0,
         alpha: int = 255,
         flip_x: bool = False,
         flip_y: bool = False,
-        pixel_art_mode: bool = False
+        pixel_art_mode: bool = False,
+        sprite_sheet: SpriteSheet | None = None,
+        frame: int | str = 0,
+        cache_rotations: bool | None = None
     ):
         """
         Initialise a Sprite component.
 
         Args:
-            image_path (str): Path to the image file (inside 'assets' folder).
+            image_path (str | None): Path to the image file (inside 'assets' folder). Not needed with a sprite_sheet.
             offset_x (float): X-axis offset relative to the Transform.
             offset_y (float): Y-axis offset relative to the Transform.
             scale_factor (float): Multiplier for scaling the sprite.
@@ -34,25 +44,80 @@ class Sprite(Component):
             flip_x (bool): Flip horizontally.
             flip_y (bool): Flip vertically.
             pixel_art_mode (bool): If True, disables smoothing for crisp pixel art.
+            sprite_sheet (SpriteSheet | None): Sheet or atlas to take the image from instead of a separate file.
+            frame (int | str): Index or name of the sheet frame to show.
+            cache_rotations (bool | None): If True, take rotated images from the shared RotationCache, with
+                angles snapped to its resolution. None follows the cache's `enabled` setting.
         """
         super().__init__()
-        self.image_path: str = image_path
-        self.original_image: pygame.Surface = load_user_image(image_path).convert_alpha()
+        self.sprite_sheet: SpriteSheet | None = sprite_sheet
+        if sprite_sheet is not None:
+            self.image_path: str = sprite_sheet.image_path
+            self.original_image: pygame.Surface = sprite_sheet.get_frame(frame)  # Region of the shared sheet image
+        elif image_path is not None:
+            self.image_path = image_path
+            self.original_image = load_user_image(image_path)  # Shared through the image cache, never modified
+        else:
+            raise ValueError("Sprite needs an image_path or a sprite_sheet")
         self.image: pygame.Surface = self.original_image
+        self._image_shared: bool = True  # image is the original or a RotationCache entry, so must not be modified
+        self._original_copy: pygame.Surface | None = None  # Own copy of the original, for drawing it translucent
+        self.cache_rotations: bool | None = cache_rotations
         self.rect: pygame.Rect = self.image.get_rect()
 
         self.transform: Transform | None = None
-        self._last_transform_state: tuple | None = None
+        # Transform rotation / scale versions the current image was built for (-1 forces a rebuild)
+        self._rotation_version: int = -1
+        self._scale_version: int = -1
         self.camera = None
-        self._scaled_image_cache: dict = {}
 
         self.offset_x: float = offset_x
         self.offset_y: float = offset_y
         self.scale_factor: float = scale_factor
         self.alpha: int = alpha
-        self.flip_x: bool = flip_x
-        self.flip_y: bool = flip_y
-        self.pixel_art_mode: bool = pixel_art_mode
+        self._flip_x: bool = flip_x
+        self._flip_y: bool = flip_y
+        self._pixel_art_mode: bool = pixel_art_mode
+
+    @property
+    def flip_x(self) -> bool:
+        return self._flip_x
+
+    @flip_x.setter
+    def flip_x(self, value: bool):
+        self._flip_x = value
+        self._rotation_version = -1  # Rebuild the image on the next update
+
+    @property
+    def flip_y(self) -> bool:
+        return self._flip_y
+
+    @flip_y.setter
+    def flip_y(self, value: bool):
+        self._flip_y = value
+        self._rotation_version = -1
+
+    @property
+    def pixel_art_mode(self) -> bool:
+        return self._pixel_art_mode
+
+    @pixel_art_mode.setter
+    def pixel_art_mode(self, value: bool):
+        self._pixel_art_mode = value
+        self._rotation_version = -1
+
+    def clone(self, cls: type | None = None) -> "Sprite":
+        """Return an unattached copy sharing the original image, which it holds its own cache reference to."""
+        clone = super().clone(cls)
+        clone._original_copy = None
+        image_cache.retain(clone.original_image)
+        return clone
+
+    def on_remove(self):
+        """Hand the original image back to the image cache and drop zoomed copies of the sprite's own image."""
+        image_cache.release(self.original_image)
+        if not self._image_shared:
+            zoom_cache.discard(self.image)
 
     def start(self):
         """Initialise transform and camera references, and apply starting transform."""
@@ -65,47 +130,49 @@ class Sprite(Component):
         self._apply_transform()
 
     def _apply_transform(self):
-        """Apply scaling, rotation, flipping, alpha, and update rect."""
-        sx, sy = self.transform.get_local_scale()
-        angle = self.transform.local_rotation
-
-        sx *= self.scale_factor
-        sy *= self.scale_factor
-        avg_scale = (sx + sy) / 2 if sx != sy else sx
-
-        # Scale and rotate image
-        if self.pixel_art_mode:
-            w, h = int(self.original_image.get_width() * sx), int(self.original_image.get_height() * sy)
-            scaled_image = pygame.transform.scale(self.original_image, (w, h))
-            if angle != 0:
-                scaled_image = pygame.transform.rotate(scaled_image, angle)
-            self.image = scaled_image
-        else:
-            self.image = pygame.transform.rotozoom(self.original_image, angle, avg_scale)
+        """Apply world scaling, rotation, flipping, alpha, and update rect."""
+        self._rotation_version = self.transform.rotation_version
+        self._scale_version = self.transform.scale_version
+
+        world_sx, world_sy = self.transform.get_world_scale()
+        angle = self.transform.get_world_rotation(radians=False)
 
-        # Apply flips
-        if self.flip_x or self.flip_y:
-            self.image = pygame.transform.flip(self.image, self.flip_x, self.flip_y)
+        sx = world_sx * self.scale_factor
+        sy = world_sy * self.scale_factor
 
-        # Apply transparency
-        self.image.set_alpha(self.alpha)
+        if not self._image_shared:
+            zoom_cache.discard(self.image)  # Nothing else draws this sprite's own image
+
+        cache_rotations = self.cache_rotations if self.cache_rotations is not None else rotation_cache.enabled
+        if cache_rotations:
+            # Shared image: alpha is applied when rendering
+            self.image = rotation_cache.get(self.original_image, angle, sx, sy, self.pixel_art_mode, self.flip_x, self.flip_y)
+            self._image_shared = True
+        else:
+            image = transform_image(self.original_image, angle, sx, sy, self.pixel_art_mode, self.flip_x, self.flip_y)
+            if image is self.original_image and self.alpha != 255:
+                image = self._get_original_copy()  # Untransformed but translucent: the shared original's alpha is left alone
+            self.image = image
+            self._image_shared = image is self.original_image
+            if not self._image_shared:
+                apply_alpha(image, self.alpha)
 
         # Update rect based on transform
-        final_x = self.transform.local_x + self.offset_x * self.scale_factor
-        final_y = self.transform.local_y + self.offset_y * self.scale_factor
+        world_x, world_y = self.transform.get_world_position()
+        final_x = world_x + self.offset_x * self.scale_factor
+        final_y = world_y + self.offset_y * self.scale_factor
         self.rect = self.image.get_rect(center=(final_x, final_y))
+        self._static_changed()
 
-        self._last_transform_state = (sx, sy, self.transform.local_rotation, self.flip_x, self.flip_y, self.pixel_art_mode)
-        self._scaled_image_cache.clear()
+        self.game_object._invalidate_aabb()
 
     def update(self, dt: float):
-        """Update sprite transform if scale or rotation changed."""
-        if not self.transform:
+        """Update sprite transform if scale, rotation, flipping or pixel-art mode changed."""
+        transform = self.transform
+        if not transform:
             return
 
-        sx, sy = self.transform.get_local_scale()
-        state = (sx, sy, self.transform.local_rotation, self.flip_x, self.flip_y, self.pixel_art_mode)
-        if state != self._last_transform_state:
+        if transform.rotation_version != self._rotation_version or transform.scale_version != self._scale_version:
             self._apply_transform()
 
     def render(self, surface: pygame.Surface):
@@ -119,38 +186,111 @@ class Sprite(Component):
 
         img = self.image
         w, h = img.get_size()
-        zoom = self.camera.zoom if self.camera else 1.0
+        camera = self.camera
+        zoom = zoom_cache.quantize(camera.zoom) if camera else 1.0
+
+        img_scaled = zoom_cache.get(img, (int(w * zoom), int(h * zoom)), smooth=not self.pixel_art_mode)
+        if img_scaled is self.original_image and self.alpha != 255:
+            img_scaled = self._get_original_copy()  # Never change the alpha of an image shared through the image cache
+        w, h = img_scaled.get_size()
+
+        if camera:
+            if not camera.is_visible(x=x, y=y, width=w, height=h):
+                return
+            screen_x, screen_y = camera.world_to_screen(x, y)
+            dest = (screen_x - w // 2, screen_y - h // 2)
+        else:
+            dest = img_scaled.get_rect(center=(x, y)).topleft
 
-        cache_key = (w, h, zoom, self.scale_factor, self.alpha, self.flip_x, self.flip_y, self.pixel_art_mode)
-        if cache_key in self._scaled_image_cache:
-            img_scaled = self._scaled_image_cache[cache_key]
+        # Zoomed and rotated images are shared, so alpha is set right before each blit
+        queue = self.game_object.scene.render_queue if self.game_object.scene else None
+        if queue is not None and queue.active:
+            queue.submit(img_scaled, dest, alpha=self.alpha)
         else:
-            w_scaled, h_scaled = int(w * zoom), int(h * zoom)
-            img_scaled = pygame.transform.scale(img, (w_scaled, h_scaled)) if self.pixel_art_mode else pygame.transform.smoothscale(img, (w_scaled, h_scaled))
-            img_scaled.set_alpha(self.alpha)
-            self._scaled_image_cache[cache_key] = img_scaled
+            apply_alpha(img_scaled, self.alpha)
+            surface.blit(img_scaled, dest)
 
-        if self.camera and not self.camera.is_visible(x=x, y=y, width=img_scaled.get_width(), height=img_scaled.get_height()):
-            return
+    def _get_original_copy(self) -> pygame.Surface:
+        """Return the sprite's own copy of the original image, made on first use."""
+        if self._original_copy is None:
+            self._original_copy = self.original_image.copy()
+        return self._original_copy
 
-        if self.camera:
-            screen_x, screen_y = self.camera.world_to_screen(x, y)
-            surface.blit(img_scaled, (screen_x - img_scaled.get_width() // 2, screen_y - img_scaled.get_height() // 2))
-        else:
-            surface.blit(img_scaled, img_scaled.get_rect(center=(x, y)).topleft)
+    def get_static_blits(self, zoom: float) -> list[tuple[pygame.Surface, tuple[float, float], int]]:
+        """Return the image as drawn at a zoom, for baking into a StaticLayer."""
+        if not self.transform or not self.image:
+            return []
+        x, y = self.transform.get_world_position()
+        x += self.offset_x * self.scale_factor
+        y += self.offset_y * self.scale_factor
+        w, h = self.image.get_size()
+        image_zoom = zoom_cache.quantize(zoom)
+        image = zoom_cache.get(self.image, (int(w * image_zoom), int(h * image_zoom)), smooth=not self.pixel_art_mode)
+        w, h = image.get_size()
+        return [(image, (x * zoom - w // 2, y * zoom - h // 2), self.alpha)]
+
+    def _static_changed(self):
+        """Re-bake the sprite's static layer chunks, if its GameObject is static."""
+        game_object = self.game_object
+        if game_object is not None and game_object._static and game_object.scene is not None:
+            game_object.scene.invalidate_static(game_object)
+
+    def on_enabled(self):
+        self._static_changed()
+
+    def on_disabled(self):
+        self._static_changed()
+
+    def get_world_aabb(self) -> tuple[float, float, float, float] | None:
+        """Return the world-space box covered by the transformed image."""
+        if not self.transform or not self.image:
+            return None
+        x, y = self.transform.get_world_position()
+        x += self.offset_x * self.scale_factor
+        y += self.offset_y * self.scale_factor
+        half_w, half_h = self.image.get_width() / 2, self.image.get_height() / 2
+        return x - half_w, y - half_h, x + half_w, y + half_h
 
     def change_image(self, new_image_path: str):
         """Change the sprite image at runtime."""
-        self.image_path = new_image_path
-        self.original_image = load_user_image(new_image_path).convert_alpha()
-        self._apply_transform()
+        image = load_user_image(new_image_path)
+        self.set_image(image, new_image_path)
+        image_cache.release(image)  # set_image took its own reference
+
+    def set_frame(self, frame: int | str):
+        """Show another frame of the sprite's sheet at runtime."""
+        if self.sprite_sheet is None:
+            raise ValueError("Sprite has no sprite_sheet to take frames from")
+        self.set_image(self.sprite_sheet.get_frame(frame))
+
+    def set_image(self, image: pygame.Surface, image_path: str | None = None):
+        """
+        Change the sprite image at runtime to an already loaded Surface, e.g. an animation frame.
+
+        Args:
+            image (pygame.Surface): The new image. It is shared, not copied, and must not be modified.
+            image_path (str | None): Path the image was loaded from, if any.
+        """
+        if image_path is not None:
+            self.image_path = image_path
+        if image is self.original_image:
+            return
+        old_image = self.original_image
+        self.original_image = image
+        self._original_copy = None
+        image_cache.retain(image)
+        image_cache.release(old_image)
+        if self.transform:
+            self._apply_transform()
 
     def set_alpha(self, alpha: int):
         """Set sprite transparency at runtime."""
         self.alpha = max(0, min(255, alpha))
-        if self.image:
-            self.image.set_alpha(self.alpha)
-        self._scaled_image_cache.clear()
+        if self.image and not self._image_shared:
+            apply_alpha(self.image, self.alpha)
+        elif self.image is self.original_image and self.transform:
+            self._apply_transform()  # Swap the shared original for a translucent copy
+        self._static_changed()
 
     def get_width(self) -> float:
         """Return the scaled width of the sprite."""
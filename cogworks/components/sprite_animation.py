@@ -1,15 +1,24 @@
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Callable
+
+import pygame
+
 from cogworks import Component
 from cogworks.components.sprite import Sprite
 from cogworks.exceptions.missing_component_error import MissingComponentError
+from cogworks.utils.asset_loader import image_cache, load_user_image
+from cogworks.utils.sprite_sheet import SpriteSheet
 
 
 @dataclass
 class Animation:
     """
     Represents a sprite-based animation sequence with optional frame events.
+
+    Frames are separate image files named sprite_path plus the frame index (e.g. "images/walk3.png"),
+    or regions of a sprite_sheet: looked up by that same name when sprite_path is set (atlases),
+    otherwise by frame index (grids).
     """
     name: str
     sprite_path: str
@@ -18,6 +27,63 @@ class Animation:
     time_between_sprites: float = 0.1
     loop: bool = True
     events: dict[int, list[Callable]] = field(default_factory=dict)
+    sprite_sheet: SpriteSheet | None = None
+    frames: list[pygame.Surface] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.time_between_sprites <= 0:
+            print(f"[WARNING] Animation '{self.name}' needs a positive time_between_sprites, using 0.1.")
+            self.time_between_sprites = 0.1
+
+    def get_frame_path(self, index: int) -> str:
+        """Return the image path of a sprite frame index, e.g. "images/walk3.png"."""
+        base, ext = os.path.splitext(self.sprite_path)
+        return f"{base}{index}{ext}"
+
+    def get_frames(self) -> list[pygame.Surface]:
+        """
+        Return the images of every frame from start_sprite_index to last_sprite_index,
+        loading them on first use. Frames are shared by every SpriteAnimation playing this animation.
+        """
+        if self.frames is None:
+            indices = range(self.start_sprite_index, self.last_sprite_index + 1)
+            if self.sprite_sheet is None:
+                self.frames = [load_user_image(self.get_frame_path(index)) for index in indices]
+            elif self.sprite_path:
+                self.frames = [self.sprite_sheet.get_frame(self.get_frame_path(index)) for index in indices]
+            else:
+                self.frames = [self.sprite_sheet.get_frame(index) for index in indices]
+        return self.frames
+
+    def get_frame(self, index: int) -> pygame.Surface:
+        """
+        Return the image of a sprite frame index.
+
+        Raises:
+            IndexError: If index is outside start_sprite_index..last_sprite_index.
+        """
+        if not self.start_sprite_index <= index <= self.last_sprite_index:
+            raise IndexError(
+                f"Sprite index {index} is outside animation '{self.name}' "
+                f"({self.start_sprite_index}..{self.last_sprite_index})."
+            )
+        return self.get_frames()[index - self.start_sprite_index]
+
+    def release_frames(self):
+        """Hand the loaded frames back to the image cache. They are loaded again on next use."""
+        if self.frames is not None and self.sprite_sheet is None:
+            for frame in self.frames:
+                image_cache.release(frame)
+        self.frames = None
+
+    def copy(self) -> "Animation":
+        """Return a copy with its own events and its own image cache references to the loaded frames."""
+        animation = replace(self, events={index: list(callbacks) for index, callbacks in self.events.items()})
+        if self.frames is not None:
+            animation.frames = list(self.frames)
+            for frame in animation.frames:
+                image_cache.retain(frame)
+        return animation
 
     def add_event(self, index: int, callback: Callable):
         """Attach a callback for a specific sprite frame index."""
@@ -34,6 +100,7 @@ class Animation:
 class SpriteAnimation(Component):
     """
     Component for managing sprite animations.
+    Each SpriteAnimation owns its Animations and hands their frames back to the image cache when removed.
     """
 
     def __init__(self):
@@ -47,9 +114,24 @@ class SpriteAnimation(Component):
 
         self.is_playing: bool = False
 
+    def clone(self, cls: type | None = None) -> "SpriteAnimation":
+        """Return an unattached copy with its own copies of the animations."""
+        clone = super().clone(cls)
+        copies = {id(animation): animation.copy() for animation in self.animations}
+        clone.animations = [copies[id(animation)] for animation in self.animations]
+        if self.selected_animation is not None:
+            clone.selected_animation = copies.get(id(self.selected_animation), self.selected_animation)
+        return clone
+
+    def on_remove(self):
+        """Hand the frames of every animation back to the image cache."""
+        for animation in self.animations:
+            animation.release_frames()
+
     def start(self):
         """Initialise the component and fetch the Sprite component."""
-        self.sprite_index = 0
+        animation = self.selected_animation
+        self.sprite_index = animation.start_sprite_index if animation is not None else 0
         self.animation_timer = 0.0
 
         self.sprite = self.game_object.get_component(Sprite)
@@ -57,31 +139,43 @@ class SpriteAnimation(Component):
             raise MissingComponentError(Sprite, self.game_object)
 
     def update(self, dt: float):
-        """Advance the animation based on the delta time."""
-        if not self.is_playing or self.selected_animation is None or self.sprite is None:
+        """
+        Advance the animation based on the delta time.
+        When dt spans several frames, the skipped frames' events are still triggered,
+        but only the last frame reached is shown.
+        """
+        animation = self.selected_animation
+        if not self.is_playing or animation is None or self.sprite is None:
             return
 
         self.animation_timer += dt
+        frame_time = animation.time_between_sprites
 
-        if self.animation_timer >= self.selected_animation.time_between_sprites:
-            base, ext = os.path.splitext(self.selected_animation.sprite_path)
-            new_path = f"{base}{self.sprite_index}{ext}"
-            self.sprite.change_image(new_path)
+        while self.animation_timer >= frame_time:
+            self.animation_timer -= frame_time
+            index = self.sprite_index
+
+            last_step = self.animation_timer < frame_time or (not animation.loop and index >= animation.last_sprite_index)
+            if last_step:
+                frame = animation.get_frame(index)
+                path = animation.get_frame_path(index) if animation.sprite_sheet is None else None
+                self.sprite.set_image(frame, path)
 
             # Trigger frame events
-            self.selected_animation.trigger_events(self.sprite_index)
+            animation.trigger_events(index)
 
             self.sprite_index += 1
 
             # Handle end of animation
-            if self.sprite_index > self.selected_animation.last_sprite_index:
-                if self.selected_animation.loop:
-                    self.sprite_index = self.selected_animation.start_sprite_index
+            if self.sprite_index > animation.last_sprite_index:
+                if animation.loop:
+                    self.sprite_index = animation.start_sprite_index
                 else:
                     self.is_playing = False
-                    self.sprite_index = self.selected_animation.last_sprite_index
+                    self.sprite_index = animation.last_sprite_index
 
-            self.animation_timer = 0.0
+            if last_step or not self.is_playing or self.selected_animation is not animation:
+                break  # Shown the final frame, or an event changed the animation
 
     def clear_selected_animation(self):
         """Clear the currently selected animation."""
@@ -98,10 +192,16 @@ class SpriteAnimation(Component):
             print(f"[WARNING] Animation '{name}' not found.")
             return
 
+        self.selected_animation.get_frames()  # Load the frames now rather than mid-animation
         self.sprite_index = self.selected_animation.start_sprite_index
         self.is_playing = play
         self.animation_timer = 0.0
 
+    def preload(self):
+        """Load the frames of every animation up front."""
+        for animation in self.animations:
+            animation.get_frames()
+
     def add_animation(
         self,
         name: str,
@@ -110,17 +210,20 @@ class SpriteAnimation(Component):
         last_sprite_index: int = 1,
         time_between_sprites: float = 0.1,
         loop: bool = True,
+        sprite_sheet: SpriteSheet | None = None,
     ) -> Animation:
         """
-        Add a new sprite animation.
+        Add a new sprite animation, replacing any animation with the same name.
 
         Args:
             name (str): Name of the animation.
-            sprite_path (str): Base path to sprite images (without index).
+            sprite_path (str): Base path to sprite images (without index), or base frame name within
+                an atlas sprite_sheet. Leave empty to use grid sprite_sheet frames by index.
             start_sprite_index (int): Index of the first sprite.
             last_sprite_index (int): Index of the last sprite.
             time_between_sprites (float): Delay between frames (minimum 0.1).
             loop (bool): Whether the animation should loop.
+            sprite_sheet (SpriteSheet | None): Sheet or atlas holding the frames.
 
         Returns:
             Animation: The created Animation object.
@@ -136,7 +239,16 @@ class SpriteAnimation(Component):
             last_sprite_index=last_sprite_index,
             time_between_sprites=time_between_sprites,
             loop=loop,
+            sprite_sheet=sprite_sheet,
         )
 
-        self.animations.append(animation)
+        for i, existing in enumerate(self.animations):
+            if existing.name == name:
+                existing.release_frames()
+                self.animations[i] = animation
+                if self.selected_animation is existing:
+                    self.set_animation(name, self.is_playing)
+                break
+        else:
+            self.animations.append(animation)
         return animation
@@ -0,0 +1,363 @@
+import math
+from array import array
+from collections import OrderedDict
+from typing import Iterable, Sequence
+
+import pygame
+import pymunk
+
+from cogworks.component import Component
+from cogworks.components.transform import Transform
+from cogworks.static_layer import premultiply
+from cogworks.utils.sprite_sheet import SpriteSheet
+from cogworks.utils.zoom_cache import zoom_cache
+
+
+class Tilemap(Component):
+    """
+    Grid of tiles drawn from a shared tileset, rendered and collided as a whole rather than as
+    one GameObject per tile.
+
+    Tiles are kept in a compact array of tileset frame numbers, row by row: 0 is an empty cell,
+    n shows frame n - 1 of the tileset. The map is drawn through square chunks of chunk_size
+    tiles, each baked into one surface the first time it is on screen, so a frame costs one
+    blit per visible chunk however large the map is. Solid tiles are merged into as few
+    rectangles as possible per chunk and added as static pymunk shapes, so Rigidbody2D
+    objects collide with the map and raycasts hit it.
+
+    The map's top-left corner sits at the GameObject's world position. Rotation and scale are
+    not applied.
+    """
+
+    queued_render = True
+
+    def __init__(
+        self,
+        tileset: SpriteSheet,
+        tiles: Sequence[Sequence[int]] | None = None,
+        width: int = 0,
+        height: int = 0,
+        tile_width: int | None = None,
+        tile_height: int | None = None,
+        solid_tiles: Iterable[int] | None = None,
+        collision: bool = True,
+        chunk_size: int = 16,
+        max_chunks: int = 256,
+        friction: float = 0.7,
+        elasticity: float = 0.0,
+        pixel_art_mode: bool = True
+    ):
+        """
+        Initialise a Tilemap component.
+
+        Args:
+            tileset (SpriteSheet): Sheet the tiles are taken from.
+            tiles (Sequence[Sequence[int]] | None): Rows of tile numbers (0 = empty, n = tileset frame n - 1).
+                Sets width and height. None starts with an empty map of width x height.
+            width (int): Width in tiles, if no tiles are given.
+            height (int): Height in tiles, if no tiles are given.
+            tile_width (int | None): Width of a cell in pixels. Defaults to the tileset's first frame.
+            tile_height (int | None): Height of a cell in pixels. Defaults to the tileset's first frame.
+            solid_tiles (Iterable[int] | None): Tile numbers that collide. None makes every non-empty tile solid.
+            collision (bool): If True, add static collision shapes for the solid tiles.
+            chunk_size (int): Width and height of a render and collision chunk, in tiles.
+            max_chunks (int): Number of baked chunks kept before the least recently drawn are dropped.
+            friction (float): Friction of the collision shapes.
+            elasticity (float): Elasticity of the collision shapes.
+            pixel_art_mode (bool): If True, chunks are scaled for the camera zoom without smoothing.
+        """
+        super().__init__()
+        if tiles is not None:
+            height = len(tiles)
+            width = len(tiles[0]) if height else 0
+            if any(len(row) != width for row in tiles):
+                raise ValueError("All tilemap rows must have the same length")
+            self.tiles = array("H", (tile for row in tiles for tile in row))
+        else:
+            self.tiles = array("H", bytes(2 * width * height))
+
+        self.tileset = tileset
+        self.width = width
+        self.height = height
+        frame_width, frame_height = tileset.get_frame(0).get_size()
+        self.tile_width = tile_width or frame_width
+        self.tile_height = tile_height or frame_height
+        self.solid_tiles: frozenset[int] | None = frozenset(solid_tiles) if solid_tiles is not None else None
+        self.collision = collision
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.friction = friction
+        self.elasticity = elasticity
+        self.pixel_art_mode = pixel_art_mode
+
+        self.transform: Transform | None = None
+        self.camera = None
+        self._chunks: OrderedDict[tuple[int, int], pygame.Surface | None] = OrderedDict()  # None = empty chunk
+        self._frames: dict[int, pygame.Surface] = {}  # Tile number -> premultiplied tileset frame
+        self._shapes: dict[tuple[int, int], list[pymunk.Shape]] = {}  # Collision shapes per chunk
+        self._origin: tuple[float, float] | None = None  # World position the shapes were built at
+        self._position_version: int = -1  # Transform position version the shapes were built for
+
+    def clone(self, cls: type | None = None) -> "Tilemap":
+        """Return an unattached copy with its own tile array, and no baked chunks or collision shapes."""
+        clone = super().clone(cls)
+        clone.tiles = array("H", self.tiles)
+        clone.transform = None
+        clone.camera = None
+        clone._chunks = OrderedDict()
+        clone._frames = {}
+        clone._shapes = {}
+        clone._origin = None
+        clone._position_version = -1
+        return clone
+
+    def start(self) -> None:
+        """Link the transform and camera, and build the collision shapes."""
+        self.transform = self.game_object.get_component(Transform)
+        self.camera = self.game_object.scene.camera_component
+        self._sync_collision()
+
+    def fixed_update(self, dt: float) -> None:
+        """
+        Move the collision shapes along if the tilemap's GameObject moved. Done in the physics
+        phase, which unlike update is not skipped while the map is far from the camera.
+        """
+        self._sync_collision()
+
+    def on_enabled(self) -> None:
+        """Add the collision shapes back after the tilemap was disabled."""
+        if self.transform is not None and self.game_object.scene is not None:
+            self._sync_collision()
+
+    def on_disabled(self) -> None:
+        """Remove the collision shapes from the physics space; they are rebuilt when the tilemap is enabled again."""
+        self._remove_shapes(list(self._shapes))
+        self._origin = None
+        self._position_version = -1
+
+    def on_remove(self) -> None:
+        """Remove the collision shapes and drop the baked chunks."""
+        self._remove_shapes(list(self._shapes))
+        self._drop_chunks(list(self._chunks))
+        self._frames.clear()
+
+    # ---------------- Tiles ----------------
+    def get_tile(self, column: int, row: int) -> int:
+        """Return the tile number at a cell (0 = empty)."""
+        if not (0 <= column < self.width and 0 <= row < self.height):
+            raise IndexError(f"Tile ({column}, {row}) is outside the {self.width}x{self.height} tilemap")
+        return self.tiles[row * self.width + column]
+
+    def set_tile(self, column: int, row: int, tile: int) -> None:
+        """
+        Change the tile at a cell. Only the chunk holding the cell is re-baked and its collision re-merged.
+
+        Args:
+            column (int): Cell column.
+            row (int): Cell row.
+            tile (int): New tile number (0 = empty).
+        """
+        if not (0 <= column < self.width and 0 <= row < self.height):
+            raise IndexError(f"Tile ({column}, {row}) is outside the {self.width}x{self.height} tilemap")
+        index = row * self.width + column
+        if self.tiles[index] == tile:
+            return
+        self.tiles[index] = tile
+        key = (column // self.chunk_size, row // self.chunk_size)
+        self._drop_chunks([key])
+        if self._origin is not None:
+            self._remove_shapes([key])
+            self._build_shapes(key)
+
+    def is_solid(self, tile: int) -> bool:
+        """Return True if a tile number collides."""
+        return tile != 0 and (self.solid_tiles is None or tile in self.solid_tiles)
+
+    def world_to_cell(self, x: float, y: float) -> tuple[int, int]:
+        """Return the (column, row) of the cell containing a world position. It may lie outside the map."""
+        origin_x, origin_y = self.transform.get_world_position()
+        return math.floor((x - origin_x) / self.tile_width), math.floor((y - origin_y) / self.tile_height)
+
+    def get_world_aabb(self) -> tuple[float, float, float, float] | None:
+        """Return the world-space box covered by the map."""
+        if not self.transform:
+            return None
+        x, y = self.transform.get_world_position()
+        return x, y, x + self.width * self.tile_width, y + self.height * self.tile_height
+
+    # ---------------- Rendering ----------------
+    def render(self, surface: pygame.Surface) -> None:
+        """Draw the chunks in the camera view."""
+        if not self.transform or not self.camera:
+            return
+        camera = self.camera
+        origin_x, origin_y = self.transform.get_world_position()
+        top, bottom, left, right = camera.get_bounds()
+        chunk_width = self.chunk_size * self.tile_width
+        chunk_height = self.chunk_size * self.tile_height
+        columns = -(-self.width // self.chunk_size)
+        rows = -(-self.height // self.chunk_size)
+        first_x = max(0, math.floor((left - origin_x) / chunk_width))
+        last_x = min(columns - 1, math.floor((right - origin_x) / chunk_width))
+        first_y = max(0, math.floor((top - origin_y) / chunk_height))
+        last_y = min(rows - 1, math.floor((bottom - origin_y) / chunk_height))
+
+        zoom = camera.zoom
+        smooth = not self.pixel_art_mode
+        scene = self.game_object.scene
+        queue = scene.render_queue if scene is not None and scene.render_queue.active else None
+        for chunk_y in range(first_y, last_y + 1):
+            screen_top = math.floor((origin_y + chunk_y * chunk_height - camera.offset_y) * zoom)
+            for chunk_x in range(first_x, last_x + 1):
+                key = (chunk_x, chunk_y)
+                if key in self._chunks:
+                    chunk = self._chunks[key]
+                    self._chunks.move_to_end(key)
+                else:
+                    chunk = self._bake(key)
+                if chunk is None:
+                    continue
+                # Size each chunk from its rounded screen edges, so neighbours meet without gaps at any zoom
+                screen_left = math.floor((origin_x + chunk_x * chunk_width - camera.offset_x) * zoom)
+                width, height = chunk.get_size()
+                screen_right = math.floor((origin_x + chunk_x * chunk_width + width - camera.offset_x) * zoom)
+                screen_bottom = math.floor((origin_y + chunk_y * chunk_height + height - camera.offset_y) * zoom)
+                image = zoom_cache.get(chunk, (screen_right - screen_left, screen_bottom - screen_top), smooth)
+                if queue is not None:
+                    queue.submit(image, (screen_left, screen_top), None, pygame.BLEND_PREMULTIPLIED)
+                else:
+                    surface.blit(image, (screen_left, screen_top), None, pygame.BLEND_PREMULTIPLIED)
+
+    def _bake(self, key: tuple[int, int]) -> pygame.Surface | None:
+        """
+        Draw the tiles of a chunk onto a new surface, with premultiplied alpha so that semi-transparent
+        tiles look the same as when drawn one by one. Returns None for a chunk with no tiles.
+        """
+        size, tile_width, tile_height = self.chunk_size, self.tile_width, self.tile_height
+        first_column, first_row = key[0] * size, key[1] * size
+        last_column, last_row = min(first_column + size, self.width), min(first_row + size, self.height)
+
+        commands = []
+        frames, tiles, width = self._frames, self.tiles, self.width
+        for row in range(first_row, last_row):
+            base = row * width
+            y = (row - first_row) * tile_height
+            for column in range(first_column, last_column):
+                tile = tiles[base + column]
+                if tile:
+                    frame = frames.get(tile)
+                    if frame is None:
+                        frame = frames[tile] = premultiply(self.tileset.get_frame(tile - 1))
+                    commands.append((frame, ((column - first_column) * tile_width, y), None, pygame.BLEND_PREMULTIPLIED))
+
+        chunk = None
+        if commands:
+            chunk = pygame.Surface(((last_column - first_column) * tile_width, (last_row - first_row) * tile_height), pygame.SRCALPHA, 32)
+            chunk.blits(commands, doreturn=False)
+        self._chunks[key] = chunk
+        while len(self._chunks) > self.max_chunks:
+            _, evicted = self._chunks.popitem(last=False)
+            if evicted is not None:
+                zoom_cache.discard(evicted)
+        return chunk
+
+    def _drop_chunks(self, keys: list[tuple[int, int]]):
+        for key in keys:
+            chunk = self._chunks.pop(key, None)
+            if chunk is not None:
+                zoom_cache.discard(chunk)
+
+    # ---------------- Collision ----------------
+    def _sync_collision(self):
+        """Rebuild the collision shapes if they are missing or were built at another position."""
+        if self.collision and self.transform.position_version != self._position_version:
+            self._rebuild_collision()
+
+    def _rebuild_collision(self):
+        """Replace every collision shape, built at the current world position."""
+        self._remove_shapes(list(self._shapes))
+        self._origin = None
+        if not self.collision:
+            return
+        self._origin = self.transform.get_world_position()
+        self._position_version = self.transform.position_version
+        size = self.chunk_size
+        for chunk_y in range(-(-self.height // size)):
+            for chunk_x in range(-(-self.width // size)):
+                self._build_shapes((chunk_x, chunk_y))
+
+    def _build_shapes(self, key: tuple[int, int]):
+        """Merge the solid tiles of a chunk into rectangles and add one static box shape per rectangle."""
+        size = self.chunk_size
+        first_column, first_row = key[0] * size, key[1] * size
+        rects = _merge_solid_cells(
+            self.tiles, self.width, self.is_solid,
+            first_column, first_row, min(first_column + size, self.width), min(first_row + size, self.height)
+        )
+        if not rects:
+            return
+        scene = self.game_object.scene
+        body = scene.physics_space.static_body
+        origin_x, origin_y = self._origin
+        tile_width, tile_height = self.tile_width, self.tile_height
+        shapes = []
+        for column, row, columns, rows in rects:
+            left, top = origin_x + column * tile_width, origin_y + row * tile_height
+            right, bottom = left + columns * tile_width, top + rows * tile_height
+            shape = pymunk.Poly(body, [(left, top), (right, top), (right, bottom), (left, bottom)])
+            shape.friction = self.friction
+            shape.elasticity = self.elasticity
+            shapes.append(shape)
+        self._shapes[key] = shapes
+        scene.add_physics_objects(*shapes)
+
+    def _remove_shapes(self, keys: list[tuple[int, int]]):
+        scene = self.game_object.scene if self.game_object is not None else None
+        for key in keys:
+            shapes = self._shapes.pop(key, None)
+            if not shapes:
+                continue
+            if scene is not None:
+                scene.remove_physics_objects(*shapes)  # Also drops shapes still waiting in a registration batch
+            elif shapes[0].space is not None:
+                shapes[0].space.remove(*shapes)
+
+
+def _merge_solid_cells(tiles, width: int, is_solid, first_column: int, first_row: int, last_column: int, last_row: int) -> list[tuple[int, int, int, int]]:
+    """
+    Cover the solid cells of a region with few rectangles: each rectangle takes the longest run of
+    uncovered solid cells along a row, then grows down while the rows below have the same run.
+
+    Returns:
+        list[tuple[int, int, int, int]]: (column, row, columns, rows) rectangles in cells.
+    """
+    region_width = last_column - first_column
+    covered = bytearray(region_width * (last_row - first_row))
+    rects = []
+    for row in range(first_row, last_row):
+        column = first_column
+        while column < last_column:
+            offset = (row - first_row) * region_width
+            if covered[offset + column - first_column] or not is_solid(tiles[row * width + column]):
+                column += 1
+                continue
+            end = column + 1
+            while end < last_column and not covered[offset + end - first_column] and is_solid(tiles[row * width + end]):
+                end += 1
+
+            bottom = row + 1
+            while bottom < last_row:
+                below = (bottom - first_row) * region_width
+                if not all(
+                    not covered[below + c - first_column] and is_solid(tiles[bottom * width + c])
+                    for c in range(column, end)
+                ):
+                    break
+                bottom += 1
+
+            for r in range(row, bottom):
+                start = (r - first_row) * region_width + column - first_column
+                covered[start:start + end - column] = b"\x01" * (end - column)
+            rects.append((column, row, end - column, bottom - row))
+            column = end
+    return rects
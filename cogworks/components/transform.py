@@ -2,11 +2,34 @@ import math
 import pygame
 from cogworks.component import Component
 
+# Change flags passed to Transform._mark_dirty, one per world value with its own version counter
+POSITION_CHANGED = 1
+ROTATION_CHANGED = 2
+SCALE_CHANGED = 4
+ALL_CHANGED = POSITION_CHANGED | ROTATION_CHANGED | SCALE_CHANGED
+
 class Transform(Component):
     """
     Transform component to track position, rotation, and scale of a GameObject.
 
     Supports both local (relative to parent) and world (absolute) transforms.
+    A child's local position is rotated and scaled by its parent, so the world
+    transform is the composition of 2D affine matrices down the hierarchy.
+
+    World positions (and transform_point) are exact. World rotation and scale are
+    reported as the sum of the rotations and the per-axis product of the scales
+    down the hierarchy, which is only exact while every rotated ancestor is scaled
+    uniformly: under a non-uniform parent scale a rotated child is really sheared,
+    which a single rotation and scale pair cannot describe.
+    World values are cached and only recomputed after this transform or one of
+    its ancestors changes; `version` increases every time the cache is invalidated.
+
+    Dependants that only care about part of the world transform can compare
+    `position_version`, `rotation_version` and `scale_version` with the values they
+    saw last, and skip their work while those are unchanged. Setting a value to
+    what it already is does not count as a change.
+
+    Positive rotation turns counter-clockwise on screen, matching pygame.transform.rotate.
 
     Attributes:
         local_x (float): Local X position relative to parent.
@@ -14,8 +37,24 @@ class Transform(Component):
         local_rotation (float): Local rotation in degrees relative to parent.
         local_scale_x (float): Local scale along X axis.
         local_scale_y (float): Local scale along Y axis.
+        version (int): Incremented whenever the world transform may have changed.
+        position_version (int): Incremented whenever the world position may have changed.
+        rotation_version (int): Incremented whenever the world rotation may have changed.
+        scale_version (int): Incremented whenever the world scale may have changed.
     """
 
+    __slots__ = (
+        "start_x", "start_y", "_local_x", "_local_y",
+        "start_rotation", "_local_rotation",
+        "start_scale_x", "_local_scale_x", "start_scale_y", "_local_scale_y",
+        "_world",
+        "_dirty", "_changes", "version", "position_version", "rotation_version", "scale_version",
+        "z_index", "world_bound_x", "world_bound_y",
+        "_rb_body", "_store", "_handle",
+    )
+
+    debug_phases = ("render",)
+
     def __init__(
         self,
         x: float = 0,
@@ -29,16 +68,27 @@ class Transform(Component):
         super().__init__()
         self.start_x = x
         self.start_y = y
-        self.local_x = x
-        self.local_y = y
+        self._local_x = x
+        self._local_y = y
 
         self.start_rotation = rotation
-        self.local_rotation = rotation
+        self._local_rotation = rotation
 
         self.start_scale_x = scale_x
-        self.local_scale_x = scale_x
+        self._local_scale_x = scale_x
         self.start_scale_y = scale_y if scale_y is not None else scale_x
-        self.local_scale_y = self.start_scale_y
+        self._local_scale_y = self.start_scale_y
+
+        # Cached world transform, valid while _dirty is False:
+        # (x, y, a, b, c, d, rotation, scale_x, scale_y) where a local point (px, py)
+        # maps to world (a*px + c*py + x, b*px + d*py + y)
+        self._world = (x, y, 1.0, 0.0, 0.0, 1.0, rotation, scale_x, self.start_scale_y)
+        self._dirty = True
+        self._changes = ALL_CHANGED  # Change flags accumulated while dirty
+        self.version = 0
+        self.position_version = 0
+        self.rotation_version = 0
+        self.scale_version = 0
 
         self.debug = debug
         self.z_index = z_index
@@ -46,86 +96,280 @@ class Transform(Component):
         self.world_bound_x: float = math.inf
         self.world_bound_y: float = math.inf
 
+        self._rb_body = None  # Set by Rigidbody2D while a physics body drives this transform
+
+        # Optional array-backed storage (see TransformStore); None while values live in this object
+        self._store = None
+        self._handle = -1
+
     def start(self):
         """Initialise world bounds and reset transform to start values."""
-        self.local_x = self.start_x
-        self.local_y = self.start_y
-        self.local_rotation = self.start_rotation
-        self.local_scale_x = self.start_scale_x
-        self.local_scale_y = self.start_scale_y
-
-        self.world_bound_x = self.game_object.scene.engine.world_bound_x
-        self.world_bound_y = self.game_object.scene.engine.world_bound_y
+        self._local_x = self.start_x
+        self._local_y = self.start_y
+        self._local_rotation = self.start_rotation
+        self._local_scale_x = self.start_scale_x
+        self._local_scale_y = self.start_scale_y
+        self._mark_dirty()
+
+        self.world_bound_x, self.world_bound_y = self.game_object.scene.get_world_bounds(self.game_object)
+
+    def clone(self, cls: type | None = None) -> "Transform":
+        """Return an unattached copy with the same local values and start values, outside any TransformStore."""
+        if cls is None:
+            cls = Transform if self._store is not None else type(self)  # a StoredTransform copies out as a plain Transform
+        if cls is not Transform:
+            clone = super().clone(cls)
+        else:
+            # Spelled out for the common case, since prefabs clone a Transform for every GameObject
+            clone = Transform.__new__(Transform)
+            clone.active = self.active
+            clone.is_runtime = self.is_runtime
+            clone._debug = self._debug
+            clone.start_x, clone.start_y = self.start_x, self.start_y
+            clone._local_x, clone._local_y = self._local_x, self._local_y
+            clone.start_rotation, clone._local_rotation = self.start_rotation, self._local_rotation
+            clone.start_scale_x, clone._local_scale_x = self.start_scale_x, self._local_scale_x
+            clone.start_scale_y, clone._local_scale_y = self.start_scale_y, self._local_scale_y
+            clone._world = self._world
+            clone.z_index = self.z_index
+            clone.world_bound_x, clone.world_bound_y = self.world_bound_x, self.world_bound_y
+            clone.game_object = None
+            clone.has_started = False
+        clone._dirty = True
+        clone._changes = ALL_CHANGED
+        clone.version = 0
+        clone.position_version = clone.rotation_version = clone.scale_version = 0
+        clone._rb_body = None
+        clone._store = None
+        clone._handle = -1
+        return clone
+
+    # --- Local attributes (writes invalidate the cached world transform) ---
+    @property
+    def local_x(self) -> float:
+        return self._local_x
+
+    @local_x.setter
+    def local_x(self, value: float):
+        if value != self._local_x:
+            self._local_x = value
+            self._mark_dirty(POSITION_CHANGED)
+
+    @property
+    def local_y(self) -> float:
+        return self._local_y
+
+    @local_y.setter
+    def local_y(self, value: float):
+        if value != self._local_y:
+            self._local_y = value
+            self._mark_dirty(POSITION_CHANGED)
+
+    @property
+    def local_rotation(self) -> float:
+        return self._local_rotation
+
+    @local_rotation.setter
+    def local_rotation(self, value: float):
+        if value != self._local_rotation:
+            self._local_rotation = value
+            self._mark_dirty(ROTATION_CHANGED)
+
+    @property
+    def local_scale_x(self) -> float:
+        return self._local_scale_x
+
+    @local_scale_x.setter
+    def local_scale_x(self, value: float):
+        if value != self._local_scale_x:
+            self._local_scale_x = value
+            self._mark_dirty(SCALE_CHANGED)
+
+    @property
+    def local_scale_y(self) -> float:
+        return self._local_scale_y
+
+    @local_scale_y.setter
+    def local_scale_y(self, value: float):
+        if value != self._local_scale_y:
+            self._local_scale_y = value
+            self._mark_dirty(SCALE_CHANGED)
+
+    # --- World cache ---
+    def _mark_dirty(self, changes: int = ALL_CHANGED):
+        """
+        Invalidate the cached world transform of this transform and all its descendants.
+        A dirty transform always has dirty descendants carrying the same changes, so subtrees
+        already dirty for those changes are skipped.
+        Newly dirtied transforms are queued on the scene's TransformHierarchy for batch updating,
+        unless they live in a TransformStore, which tracks its own dirty flags, and the bounding
+        boxes of the GameObject and its ancestors are invalidated.
+
+        Args:
+            changes (int): Which world values changed (POSITION_CHANGED, ROTATION_CHANGED, SCALE_CHANGED flags).
+        """
+        pending = self._changes if self._dirty else 0
+        new = changes & ~pending
+        if not new:
+            return
+        self._changes = pending | new
+        if new & POSITION_CHANGED:
+            self.position_version += 1
+        if new & ROTATION_CHANGED:
+            self.rotation_version += 1
+        if new & SCALE_CHANGED:
+            self.scale_version += 1
+
+        game_object = self.game_object
+        if not pending:
+            self._dirty = True
+            self.version += 1
+            if game_object is not None:
+                game_object._invalidate_aabb()
+                if game_object._static and game_object.scene is not None:
+                    game_object.scene.invalidate_static(game_object)
+                if game_object.scene is not None and self._store is None:
+                    game_object.scene.transform_hierarchy.register(self)
+        if game_object is not None:
+            # Any change to a parent moves its children; rotation and scale also carry over
+            for child in game_object.children:
+                child.transform._mark_dirty(new | POSITION_CHANGED)
+
+    def _on_parent_changed(self):
+        """
+        Called after this transform's GameObject was re-parented. Moves the transform (and its
+        descendants) in or out of the parent's TransformStore as needed, then invalidates it.
+        """
+        parent = self.game_object.parent
+        parent_store = parent.transform._store if parent is not None else None
+        store = self._store
+        if parent_store is not None and parent_store is store:
+            store.reparent(self)
+        else:
+            if store is not None:
+                store.release_hierarchy(self.game_object)
+            if parent_store is not None:
+                parent_store.bind_hierarchy(self.game_object)
+        self._mark_dirty()
+
+    def _update_world(self):
+        """Recompute the cached world transform from the parent's (cached) world transform."""
+        sx, sy = self._local_scale_x, self._local_scale_y
+        radians = math.radians(self._local_rotation)
+        cos, sin = math.cos(radians), math.sin(radians)
+        la, lb, lc, ld = sx * cos, -sx * sin, sy * sin, sy * cos
+
+        parent = self.game_object.parent if self.game_object is not None else None
+        if parent is not None:
+            pt = parent.transform
+            if pt._dirty:
+                pt._update_world()
+            px, py, pa, pb, pc, pd, prot, psx, psy = pt._world
+            lx, ly = self._local_x, self._local_y
+            self._world = (
+                pa * lx + pc * ly + px,
+                pb * lx + pd * ly + py,
+                pa * la + pc * lb,
+                pb * la + pd * lb,
+                pa * lc + pc * ld,
+                pb * lc + pd * ld,
+                prot + self._local_rotation,
+                psx * sx,
+                psy * sy,
+            )
+        else:
+            self._world = (self._local_x, self._local_y, la, lb, lc, ld, self._local_rotation, sx, sy)
+        self._dirty = False
+
+    def transform_point(self, x: float, y: float) -> tuple[float, float]:
+        """Convert a point from this transform's local space to world space."""
+        if self._dirty:
+            self._update_world()
+        wx, wy, a, b, c, d = self._world[:6]
+        return a * x + c * y + wx, b * x + d * y + wy
+
+    def inverse_transform_point(self, x: float, y: float) -> tuple[float, float]:
+        """Convert a point from world space to this transform's local space."""
+        if self._dirty:
+            self._update_world()
+        wx, wy, a, b, c, d = self._world[:6]
+        det = a * d - b * c
+        dx, dy = x - wx, y - wy
+        if det == 0:
+            return dx, dy
+        return (d * dx - c * dy) / det, (a * dy - b * dx) / det
 
     # --- Local setters / getters ---
     def set_local_position(self, x: float, y: float):
-        self.local_x = x
-        self.local_y = y
+        if x != self._local_x or y != self._local_y:
+            self._local_x = x
+            self._local_y = y
+            self._mark_dirty(POSITION_CHANGED)
 
     def get_local_position(self) -> tuple[float, float]:
-        return self.local_x, self.local_y
+        return self._local_x, self._local_y
 
     def set_local_rotation(self, degrees: float):
-        self.local_rotation = degrees % 360
+        degrees %= 360
+        if degrees != self._local_rotation:
+            self._local_rotation = degrees
+            self._mark_dirty(ROTATION_CHANGED)
 
     def get_local_rotation(self, radians: bool = True) -> float:
-        return math.radians(self.local_rotation) if radians else self.local_rotation
+        return math.radians(self._local_rotation) if radians else self._local_rotation
 
     def set_local_scale(self, sx: float, sy: float | None = None):
-        self.local_scale_x = sx
-        self.local_scale_y = sy if sy is not None else sx
+        sy = sy if sy is not None else sx
+        if sx != self._local_scale_x or sy != self._local_scale_y:
+            self._local_scale_x = sx
+            self._local_scale_y = sy
+            self._mark_dirty(SCALE_CHANGED)
 
     def get_local_scale(self) -> tuple[float, float]:
-        return self.local_scale_x, self.local_scale_y
+        return self._local_scale_x, self._local_scale_y
 
     # --- World setters ---
     def set_world_position(self, x: float, y: float):
         if self.game_object and self.game_object.parent:
-            px, py = self.game_object.parent.transform.get_world_position()
-            self.local_x = x - px
-            self.local_y = y - py
+            self.set_local_position(*self.game_object.parent.transform.inverse_transform_point(x, y))
         else:
-            self.local_x = x
-            self.local_y = y
+            self.set_local_position(x, y)
 
     def set_world_rotation(self, degrees: float):
         if self.game_object and self.game_object.parent:
             parent_rotation = self.game_object.parent.transform.get_world_rotation(radians=False)
-            self.local_rotation = (degrees - parent_rotation) % 360
+            self.set_local_rotation(degrees - parent_rotation)
         else:
-            self.local_rotation = degrees % 360
+            self.set_local_rotation(degrees)
 
     def set_world_scale(self, sx: float, sy: float | None = None):
         if self.game_object and self.game_object.parent:
             psx, psy = self.game_object.parent.transform.get_world_scale()
-            self.local_scale_x = sx / psx
-            self.local_scale_y = (sy / psy) if sy is not None else (sx / psx)
+            self.set_local_scale(sx / psx, (sy / psy) if sy is not None else (sx / psx))
         else:
-            self.local_scale_x = sx
-            self.local_scale_y = sy if sy is not None else sx
+            self.set_local_scale(sx, sy)
 
     def rotate(self, delta_degrees: float):
-        self.local_rotation = (self.local_rotation + delta_degrees) % 360
+        self.set_local_rotation(self._local_rotation + delta_degrees)
 
     # --- World getters ---
     def get_world_position(self) -> tuple[float, float]:
-        if self.game_object and self.game_object.parent:
-            px, py = self.game_object.parent.transform.get_world_position()
-            return px + self.local_x, py + self.local_y
-        return self.local_x, self.local_y
+        if self._dirty:
+            self._update_world()
+        world = self._world
+        return world[0], world[1]
 
     def get_world_rotation(self, radians: bool = True) -> float:
-        angle = self.local_rotation
-        if self.game_object and self.game_object.parent:
-            angle += self.game_object.parent.transform.get_world_rotation(radians=False)
-        return math.radians(angle) if radians else angle
+        if self._dirty:
+            self._update_world()
+        rotation = self._world[6]
+        return math.radians(rotation) if radians else rotation
 
     def get_world_scale(self) -> tuple[float, float]:
-        sx, sy = self.local_scale_x, self.local_scale_y
-        if self.game_object and self.game_object.parent:
-            psx, psy = self.game_object.parent.transform.get_world_scale()
-            return sx * psx, sy * psy
-        return sx, sy
+        if self._dirty:
+            self._update_world()
+        world = self._world
+        return world[7], world[8]
 
     # --- Direction helpers ---
     def get_forward(self) -> tuple[float, float]:
@@ -146,6 +390,7 @@ class Transform(Component):
 
     # --- Bounds check ---
     def check_bounds(self) -> None:
+        """Destroy the GameObject if it lies outside its world bounds. Scenes check all objects at once each frame."""
         x, y = self.get_world_position()
         if x < -self.world_bound_x or x > self.world_bound_x or y < -self.world_bound_y or y > self.world_bound_y:
             self.game_object.destroy()
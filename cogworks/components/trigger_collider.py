@@ -9,6 +9,8 @@ class TriggerCollider(Component):
     Supports rectangular and circular shapes with optional layer filtering.
     """
 
+    debug_phases = ("render",)
+
     def __init__(
             self,
             shape: str = "rect",
@@ -39,18 +41,55 @@ class TriggerCollider(Component):
         super().__init__()
         self.transform = None
         self.shape: str = shape
-        self.width: int = width
-        self.height: int = height
+        self._width: int = width
+        self._height: int = height
         self.radius: int = radius
-        self.offset_x: float = offset_x
-        self.offset_y: float = offset_y
+        self._offset_x: float = offset_x
+        self._offset_y: float = offset_y
         self.rect: Optional[pygame.Rect] = None
+        self._shape_version: int = -1  # Transform position version the shape was placed for (-1 forces an update)
         self.center: Optional[tuple[float, float]] = None
         self._colliding_with: Set["TriggerCollider"] = set()
         self.layer: str = layer
         self.debug: bool = debug
         self.layer_mask: Optional[List[str]] = layer_mask
 
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @width.setter
+    def width(self, value: int):
+        self._width = value
+        self._shape_version = -1  # Re-place the shape on the next update
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @height.setter
+    def height(self, value: int):
+        self._height = value
+        self._shape_version = -1
+
+    @property
+    def offset_x(self) -> float:
+        return self._offset_x
+
+    @offset_x.setter
+    def offset_x(self, value: float):
+        self._offset_x = value
+        self._shape_version = -1
+
+    @property
+    def offset_y(self) -> float:
+        return self._offset_y
+
+    @offset_y.setter
+    def offset_y(self, value: float):
+        self._offset_y = value
+        self._shape_version = -1
+
     def start(self):
         """Initialise collider dimensions and register with collision manager."""
         self.transform = self.game_object.transform
@@ -68,22 +107,24 @@ class TriggerCollider(Component):
 
         self.update_shape()
 
-        self.game_object.scene.trigger_collision_manager.register(self)
+        self.game_object.scene.register_trigger_collider(self)
 
     def update_shape(self):
         """Update collider position based on Transform and offset."""
+        self._shape_version = self.transform.position_version
         x, y = self.transform.get_world_position()
-        x += self.offset_x
-        y += self.offset_y
+        x += self._offset_x
+        y += self._offset_y
 
         if self.shape == "rect":
-            self.rect = pygame.Rect(x - self.width // 2, y - self.height // 2, self.width, self.height)
+            self.rect = pygame.Rect(x - self._width // 2, y - self._height // 2, self._width, self._height)
             self.center = self.rect.center
         elif self.shape == "circle":
             self.center = (x, y)
 
     def update(self, dt: float):
-        self.update_shape()
+        if self.transform.position_version != self._shape_version:
+            self.update_shape()
 
     def on_remove(self):
         self.game_object.scene.trigger_collision_manager.unregister(self)
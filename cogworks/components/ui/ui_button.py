@@ -70,7 +70,6 @@ class UIButton(UIRenderer):
         mouse_pos = pygame.mouse.get_pos()
         self.hovered = rect.collidepoint(mouse_pos)
 
-        rect = self.game_object.get_component(UITransform).rect
         color = tuple(min(c + 50, 255) if self.hovered else c for c in self.bg_color)
         pygame.draw.rect(surface, color, rect, border_radius=self.border_radius)
         text_surf = self.font.render(self.text, True, self.text_color)
@@ -1,21 +1,35 @@
 import pygame
 from cogworks.components.ui.ui_transform import UITransform
 from cogworks.components.ui.ui_renderer import UIRenderer
-from cogworks.utils.asset_loader import load_engine_image, load_user_image
+from cogworks.utils.asset_loader import image_cache, load_engine_image, load_user_image
 
 
 class UIImage(UIRenderer):
     """
     UIImage renders an image respecting UITransform's rect and anchor.
     Scales proportionally, preserving aspect ratio, and aligns to the anchor.
+    The image is taken from the image cache and handed back when replaced or when the component is removed.
     """
 
     def __init__(self, image_path, load_engine=False):
         super().__init__()
         self.image = load_engine_image(image_path) if load_engine else load_user_image(image_path)
 
+    def clone(self, cls: type | None = None) -> "UIImage":
+        """Return an unattached copy sharing the image, which it holds its own cache reference to."""
+        clone = super().clone(cls)
+        image_cache.retain(clone.image)
+        return clone
+
+    def on_remove(self):
+        """Hand the image back to the image cache."""
+        image_cache.release(self.image)
+
     def set_image(self, image_path, load_engine=False):
+        """Change the image at runtime, handing the previous one back to the image cache."""
+        old_image = self.image
         self.image = load_engine_image(image_path) if load_engine else load_user_image(image_path)
+        image_cache.release(old_image)
 
     def render(self, surface):
         ui_transform = self.game_object.get_component(UITransform)
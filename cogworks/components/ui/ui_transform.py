@@ -11,6 +11,8 @@ class UITransform(Component):
     can follow world-space movement or adjust correctly to zoom.
     """
 
+    debug_phases = ("render",)
+
     def __init__(self, x=0, y=0, width=1, height=1, anchor="topleft", relative=True, world_space=False, debug=False):
         """
         Args:
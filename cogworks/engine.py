@@ -61,9 +61,9 @@ class Engine:
         # Schedule the scene change for the next frame
         self.schedule_next_frame(change_scene)
 
-    def create_scene(self, scene_name: str, gravity=(0, 900)) -> Scene:
+    def create_scene(self, scene_name: str, gravity=(0, 900), use_transform_store: bool = False) -> Scene:
         """Create a new scene and add it to scene manager."""
-        new_scene = Scene(scene_name, gravity)
+        new_scene = Scene(scene_name, gravity, use_transform_store=use_transform_store)
         self.scene_manager.add_scene(new_scene, self)
         return new_scene
 
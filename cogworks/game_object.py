@@ -1,7 +1,19 @@
+import math
 import uuid
+from bisect import insort
 
+from cogworks.component import slot_fields
 from cogworks.components.transform import Transform
 
+# Keys under which _index_components files a lone Transform
+_TRANSFORM_INDEX_KEYS = ("Transform",) + tuple(key for klass in Transform.__mro__ for key in (klass, klass.__name__))
+
+_NO_COMPONENTS = ()
+
+
+def _z_index_of(component) -> int:
+    return getattr(component, "z_index", 0)
+
 
 class GameObject:
     """
@@ -10,15 +22,27 @@ class GameObject:
     such as rendering, physics, or custom logic.
     """
 
+    __slots__ = (
+        "_uuid", "id", "name", "_active", "z_index", "is_ui_object", "layer", "world_bounds", "_static",
+        "scene", "camera",
+        "initial_components", "_sorted_components", "_runtime_components", "_components",
+        "_component_index", "_update_components", "_fixed_update_components", "_render_components",
+        "transform",
+        "parent", "initial_children", "_runtime_children", "_children",
+        "_aabb", "_own_aabb", "__weakref__",
+    )
+
     _id_counter = 0  # class-level counter for incremental IDs
 
-    def __init__(self, name: str = "GameObject", z_index: int = 0, x: float = 0, y: float = 0, scale_x: float = 1, scale_y: float = 1, rotation: float = 0):
+    def __init__(self, name: str = "GameObject", z_index: int = 0, x: float = 0, y: float = 0, scale_x: float = 1, scale_y: float = 1, rotation: float = 0, layer: str = "Default", static: bool = False):
         """
         Initialise a new GameObject with a unique identifier.
         Automatically adds a Transform component.
+        The layer selects per-layer world bounds (see Scene.set_layer_world_bounds).
+        Static GameObjects have their sprites baked into the scene's static layers (see `static`).
         """
         # Assign unique IDs
-        self.uuid = uuid.uuid4()          # Globally unique identifier
+        self._uuid = None                 # Globally unique identifier, generated on first access
         self.id = GameObject._id_counter  # Local incremental ID
         GameObject._id_counter += 1
 
@@ -27,24 +51,91 @@ class GameObject:
         self._active = True
         self.z_index = z_index
         self.is_ui_object = False
+        self.layer = layer
+        self.world_bounds: tuple[float, float] | None = None  # Overrides the layer / engine world bounds
+        self._static = static
 
         # Scene
         self.scene = None
         self.camera = None
 
-        # Component storage
-        self.initial_components: list = []
-        self._sorted_components: list = []
-        self.runtime_components: list = []
-
-        # Add default Transform component
-        self.transform = Transform(x=x, y=y, scale_x=scale_x, scale_y=scale_y, rotation=rotation)
-        self.add_component(self.transform)
-
         # ---------------- Hierarchy ----------------
         self.parent: "GameObject | None" = None  # Parent GameObject
         self.initial_children: list["GameObject"] = []
-        self.runtime_children: list["GameObject"] = []
+        self._runtime_children: list["GameObject"] | None = None
+        self._children: list["GameObject"] = []  # initial + runtime, rebuilt only when children change
+
+        # World-space box around this GameObject and its descendants, None while stale (see get_aabb)
+        self._aabb: tuple[float, float, float, float] | None = None
+        self._own_aabb: tuple[float, float, float, float] | None = None  # Same, without descendants
+
+        # Default Transform component, attached directly: a new GameObject cannot hold a duplicate yet,
+        # so add_component's checks, index rebuild and sorting are skipped
+        transform = Transform(x=x, y=y, scale_x=scale_x, scale_y=scale_y, rotation=rotation)
+        transform.game_object = self
+        self.transform = transform
+
+        # Component storage (runtime list is created on first use)
+        self.initial_components: list = [transform]
+        self._sorted_components: list = [transform]
+        self._runtime_components: list | None = None
+        self._components: list = [transform]  # initial + runtime, rebuilt only when components change
+        self._component_index: dict = dict.fromkeys(_TRANSFORM_INDEX_KEYS, transform)  # type / class name -> first matching component
+
+        # Per-phase dispatch lists, holding only components that do work in that phase.
+        # They are always replaced rather than mutated, so they start as one shared empty tuple.
+        self._update_components = _NO_COMPONENTS
+        self._fixed_update_components = _NO_COMPONENTS
+        self._render_components = _NO_COMPONENTS
+
+    @property
+    def uuid(self):
+        """Globally unique identifier (uuid4), generated lazily on first access."""
+        if self._uuid is None:
+            self._uuid = uuid.uuid4()
+        return self._uuid
+
+    @uuid.setter
+    def uuid(self, value):
+        self._uuid = value
+
+    @property
+    def static(self) -> bool:
+        """
+        Whether this GameObject is static scenery. Bakeable components (e.g. Sprite) of static
+        GameObjects are pre-composited into cached chunks (see StaticLayer) instead of being drawn
+        every frame. Static GameObjects may still change; each change re-bakes the chunks around
+        them, so this is for objects that rarely do.
+        """
+        return self._static
+
+    @static.setter
+    def static(self, value: bool):
+        self._static = value
+        if self.scene is not None:
+            self.scene._dispatch_dirty = True
+
+    @property
+    def runtime_components(self) -> list:
+        """Components added after the scene started. Created on first access."""
+        if self._runtime_components is None:
+            self._runtime_components = []
+        return self._runtime_components
+
+    @runtime_components.setter
+    def runtime_components(self, value: list | None):
+        self._runtime_components = value
+
+    @property
+    def runtime_children(self) -> list["GameObject"]:
+        """Children added after the scene started. Created on first access."""
+        if self._runtime_children is None:
+            self._runtime_children = []
+        return self._runtime_children
+
+    @runtime_children.setter
+    def runtime_children(self, value: list["GameObject"] | None):
+        self._runtime_children = value
 
     # ---------------- Component Management ----------------
     def add_component(self, component) -> None:
@@ -68,15 +159,20 @@ class GameObject:
             raise ValueError("Cannot add Rigidbody2D to a child GameObject")
 
         component.game_object = self
-        target_list = self.runtime_components if self.scene and self.scene.has_started else self.initial_components
+        if self.scene and self.scene.has_started:
+            self.runtime_components.append(component)
+            self._append_component(component)
+        else:
+            self.initial_components.append(component)
+            if self._runtime_components:
+                self._refresh_components()
+            else:
+                self._append_component(component)
 
-        target_list.append(component)
         if self.scene and self.scene.has_started:
             component.start()
             component.has_started = True
 
-        self._sort_components()
-
     def remove_component(self, component_type) -> bool:
         """
         Remove the first component of the given type from the GameObject.
@@ -94,7 +190,7 @@ class GameObject:
                     comp.on_remove()
                 components.pop(i)
                 del comp
-                self._sort_components()
+                self._refresh_components()
                 return True
         return False
 
@@ -102,18 +198,9 @@ class GameObject:
         """
         Retrieve the first component of a given type.
         Accepts either the class type or a string with the class name.
+        Base classes match their subclasses, so get_component(Component) returns the first component.
         """
-        # Cache concatenation to avoid repeated list creation
-        components = self._all_components
-        if isinstance(component_type, str):
-            for comp in components:
-                if comp.__class__.__name__ == component_type:
-                    return comp
-        else:
-            for comp in components:
-                if isinstance(comp, component_type):
-                    return comp
-        return None
+        return self._component_index.get(component_type)
 
     def has_component(self, component) -> bool:
         """
@@ -122,21 +209,183 @@ class GameObject:
         """
         return self.get_component(component) is not None
 
+    def _refresh_components(self):
+        """
+        Rebuild the merged and z-sorted component lists after a component is added or removed.
+        Both lists are replaced rather than mutated, so loops already iterating them are unaffected.
+        """
+        if self._runtime_components:
+            self._components = self.initial_components + self._runtime_components
+        else:
+            self._components = list(self.initial_components)
+        self._index_components()
+        self._sort_components()
+
+    def _append_component(self, component):
+        """
+        Incremental form of _refresh_components for a component that ends up last in the merged list.
+        Produces the same lists and index without re-walking the existing components.
+        """
+        self._components = self._components + [component]
+
+        index = self._component_index
+        component_type = type(component)
+        name = component_type.__name__
+        existing = index.get(name)
+        if existing is None or type(existing).__name__ != name:
+            index[name] = component  # Exact class names take priority over base class names
+        for klass in component_type.__mro__:
+            index.setdefault(klass, component)
+            index.setdefault(klass.__name__, component)
+
+        sorted_components = list(self._sorted_components)
+        insort(sorted_components, component, key=_z_index_of)
+        self._sorted_components = sorted_components
+
+        if component.handles_phase("update"):
+            self._update_components = [*self._update_components, component]
+        if component.handles_phase("fixed_update"):
+            self._fixed_update_components = [*self._fixed_update_components, component]
+        if component.handles_phase("render"):
+            self._render_components = [c for c in sorted_components if c.handles_phase("render")]
+
+        self._invalidate_aabb()
+        if self.scene is not None:
+            self.scene._dispatch_dirty = True
+
+    def _index_components(self):
+        """
+        Map every class in each component's MRO (and its name) to the first matching component,
+        so get_component is a single dict lookup. Exact class names take priority over base class names.
+        """
+        index = {}
+        components = self._components
+        for comp in components:
+            index.setdefault(type(comp).__name__, comp)
+        for comp in components:
+            for klass in type(comp).__mro__:
+                index.setdefault(klass, comp)
+                index.setdefault(klass.__name__, comp)
+        self._component_index = index
+
     def _sort_components(self):
         """Maintain a sorted list of components by z_index."""
-        self._sorted_components = sorted(
-            self._all_components,
-            key=lambda c: getattr(c, "z_index", 0)
-        )
+        self._sorted_components = sorted(self._components, key=_z_index_of)
+        self._refresh_dispatch()
 
-    @property
-    def _all_components(self):
-        """Cache for faster access instead of concatenating repeatedly"""
-        return self.initial_components + self.runtime_components
+    def _refresh_dispatch(self):
+        """
+        Rebuild the per-phase dispatch lists so update, fixed_update and render
+        only call components that override that phase (see Component.handles_phase).
+        """
+        components = self._components
+        self._update_components = [c for c in components if c.handles_phase("update")]
+        self._fixed_update_components = [c for c in components if c.handles_phase("fixed_update")]
+        self._render_components = [c for c in self._sorted_components if c.handles_phase("render")]
+        self._invalidate_aabb()
+        if self.scene is not None:
+            self.scene._dispatch_dirty = True
 
     @property
-    def components(self):
-        return self._all_components
+    def components(self) -> list:
+        """All components (initial + runtime). The returned list is shared and must not be mutated."""
+        return self._components
+
+    # ---------------- Cloning ----------------
+    def clone(self, memo: dict | None = None, relink: bool = True) -> "GameObject":
+        """
+        Return a detached copy of this GameObject and its descendants, outside any scene and not started.
+        Components are copied with Component.clone, so immutable payloads such as images, fonts and
+        sounds are shared. Component fields that point at GameObjects or components inside the cloned
+        hierarchy are redirected to their copies.
+
+        Args:
+            memo (dict | None): Maps id() of already cloned objects to their copies. Leave as None.
+            relink (bool): Redirect internal references. Can be skipped when the hierarchy has none
+                (see Prefab), as no component fields then need scanning.
+        """
+        is_root = memo is None
+        if is_root:
+            memo = {}
+
+        cls = type(self)
+        clone = cls.__new__(cls)
+        memo[id(self)] = clone
+        fields = getattr(self, "__dict__", None)
+        if fields:
+            clone.__dict__.update(fields)
+
+        clone._uuid = None
+        clone.id = GameObject._id_counter
+        GameObject._id_counter += 1
+        clone.name = self.name
+        clone._active = self._active
+        clone.z_index = self.z_index
+        clone.is_ui_object = self.is_ui_object
+        clone.layer = self.layer
+        clone.world_bounds = self.world_bounds
+        clone._static = self._static
+        clone.scene = None
+        clone.camera = None
+        clone.parent = None
+        clone._aabb = None
+        clone._own_aabb = None
+
+        # Components: the clone's lists mirror this GameObject's, so no re-indexing or re-sorting is needed
+        components = []
+        for comp in self._components:
+            comp_clone = comp.clone()
+            comp_clone.game_object = clone
+            memo[id(comp)] = comp_clone
+            components.append(comp_clone)
+        clone.transform = memo[id(self.transform)]
+        clone.initial_components = components
+        clone._runtime_components = None
+        clone._components = list(components)
+        clone._component_index = {key: memo[id(comp)] for key, comp in self._component_index.items()}
+        clone._sorted_components = [memo[id(comp)] for comp in self._sorted_components]
+        clone._update_components = [memo[id(comp)] for comp in self._update_components] or _NO_COMPONENTS
+        clone._fixed_update_components = [memo[id(comp)] for comp in self._fixed_update_components] or _NO_COMPONENTS
+        clone._render_components = [memo[id(comp)] for comp in self._render_components] or _NO_COMPONENTS
+
+        children = []
+        for child in self._children:
+            child_clone = child.clone(memo)
+            child_clone.parent = clone
+            children.append(child_clone)
+        clone.initial_children = children
+        clone._runtime_children = None
+        clone._children = list(children)
+
+        if is_root and relink:
+            clone._relink_clones(memo)
+        return clone
+
+    def _relink_clones(self, memo: dict) -> int:
+        """
+        Point component fields that still reference originals (e.g. Sprite.transform) at their clones.
+
+        Returns:
+            int: The number of fields redirected in this hierarchy.
+        """
+        count = 0
+        for comp in self._components:
+            for name in slot_fields(type(comp)):
+                if name == "game_object":
+                    continue  # Already set to the owning clone
+                value = getattr(comp, name, None)
+                if value is not None and id(value) in memo:
+                    setattr(comp, name, memo[id(value)])
+                    count += 1
+            fields = getattr(comp, "__dict__", None)
+            if fields:
+                for name, value in fields.items():
+                    if id(value) in memo:
+                        fields[name] = memo[id(value)]
+                        count += 1
+        for child in self._children:
+            count += child._relink_clones(memo)
+        return count
 
     # ---------------- Hierarchy Management ----------------
     def add_child(self, child: "GameObject") -> None:
@@ -149,19 +398,24 @@ class GameObject:
             child.parent.remove_child(child)
         child.parent = self
         child.scene = self.scene
+        child.transform._on_parent_changed()  # world transform is now relative to this GameObject
 
         target_list = self.runtime_children if self.scene and self.scene.has_started else self.initial_children
         target_list.append(child)
+        self._refresh_children()
 
         if self.scene:
             child._set_scene_recursive(self.scene)  # propagate scene to child and descendants
+            self.scene.spatial_index.insert_hierarchy(child)
 
         if self.scene and self.scene.has_started:
             child.start()
 
     def _set_scene_recursive(self, scene):
         self.scene = scene
-        for child in self._all_children:
+        if scene is not None and not self.is_ui_object:
+            scene.visible_objects.add(self)  # Updated until the scene next works out what is near the camera
+        for child in self._children:
             child._set_scene_recursive(scene)
 
     def remove_child(self, child: "GameObject") -> None:
@@ -172,6 +426,23 @@ class GameObject:
         if child in target_list:
             target_list.remove(child)
             child.parent = None
+            child.transform._on_parent_changed()
+            self._refresh_children()
+            if self.scene is not None:
+                self.scene.spatial_index.remove_hierarchy(child)
+
+    def set_world_bounds(self, bound_x: float = math.inf, bound_y: float | None = None) -> None:
+        """
+        Override the world bounds for this GameObject. Leaving the object's world position beyond
+        them destroys it. Call with no arguments to exempt the object (e.g. static level geometry).
+
+        Args:
+            bound_x (float): Maximum absolute world x position.
+            bound_y (float | None): Maximum absolute world y position. Defaults to bound_x.
+        """
+        self.world_bounds = (bound_x, bound_y if bound_y is not None else bound_x)
+        if self.scene is not None and self.scene.engine is not None:
+            self.transform.world_bound_x, self.transform.world_bound_y = self.scene.get_world_bounds(self)
 
     def get_children(self) -> list["GameObject"]:
         """
@@ -179,14 +450,65 @@ class GameObject:
         """
         return self.children
 
-    @property
-    def _all_children(self):
-        """Cache for faster access instead of concatenating repeatedly"""
-        return self.initial_children + self.runtime_children
+    def _refresh_children(self):
+        """
+        Rebuild the merged child list after a child is added or removed.
+        The list is replaced rather than mutated, so loops already iterating it are unaffected.
+        """
+        if self._runtime_children:
+            self._children = self.initial_children + self._runtime_children
+        else:
+            self._children = list(self.initial_children)
+        self._invalidate_aabb()
+        if self.scene is not None:
+            self.scene._dispatch_dirty = True
 
     @property
-    def children(self):
-        return self._all_children
+    def children(self) -> list["GameObject"]:
+        """All children (initial + runtime). The returned list is shared and must not be mutated."""
+        return self._children
+
+    # ---------------- Bounding Volumes ----------------
+    def get_aabb(self) -> tuple[float, float, float, float]:
+        """
+        Return the world-space axis-aligned box (left, top, right, bottom) enclosing this GameObject's
+        position, everything its components draw and the boxes of all its descendants.
+        The box is cached and only recomputed after something in the subtree changed.
+        """
+        aabb = self._aabb
+        if aabb is None:
+            left, top = right, bottom = self.transform.get_world_position()
+            for comp in self._components:
+                box = comp.get_world_aabb()
+                if box is not None:
+                    if box[0] < left: left = box[0]
+                    if box[1] < top: top = box[1]
+                    if box[2] > right: right = box[2]
+                    if box[3] > bottom: bottom = box[3]
+            self._own_aabb = (left, top, right, bottom)
+            for child in self._children:
+                box = child.get_aabb()
+                if box[0] < left: left = box[0]
+                if box[1] < top: top = box[1]
+                if box[2] > right: right = box[2]
+                if box[3] > bottom: bottom = box[3]
+            aabb = self._aabb = (left, top, right, bottom)
+        return aabb
+
+    def get_own_aabb(self) -> tuple[float, float, float, float]:
+        """Return the world-space box enclosing this GameObject's position and what its own components draw."""
+        if self._aabb is None:
+            self.get_aabb()
+        return self._own_aabb
+
+    def _invalidate_aabb(self):
+        """Mark the bounding box of this GameObject and its ancestors as stale, and queue them on the scene's SpatialIndex."""
+        game_object = self
+        while game_object is not None and game_object._aabb is not None:
+            game_object._aabb = None
+            if game_object.scene is not None:
+                game_object.scene.spatial_index.mark_moved(game_object)
+            game_object = game_object.parent
 
     # ---------------- Lifecycle ----------------
     def start(self) -> None:
@@ -205,67 +527,100 @@ class GameObject:
 
     def update(self, dt: float) -> None:
         """
-        Update all components and children.
-        """
-        if not self._active:
-            return
+        Update the components of this object and its children directly.
 
-        if not self.is_ui_object: self.transform.check_bounds()
+        Scene.update does not call this: it runs components from its own flattened dispatch
+        order, so overriding update() in a GameObject subclass does not change what the scene
+        runs. Put per-frame logic in a Component. Subtrees are skipped exactly as the scene
+        skips them (see _skips_update).
 
-        x, y = self.transform.get_world_position()
-        if not self.is_ui_object and not self.camera.is_visible(x=x, y=y, width=0, height=0, tolerance=2000):
+        Args:
+            dt (float): Delta time since last frame.
+        """
+        scene = self.scene
+        if self._skips_update(scene.visible_objects if scene is not None else None):
             return
 
-        components = self._all_components
-        children = self._all_children
-
-        for comp in components:
+        for comp in self._update_components:
             if comp.has_started:
                 comp.update(dt)
-        for child in children:
+        for child in self._children:
             child.update(dt)
 
     def fixed_update(self, dt: float) -> None:
         """
-        Fixed timestep update for physics or deterministic logic.
-        Calls fixed_update on all components that implement it, including children.
+        Run fixed_update on the components of this object and its children directly.
+
+        Scene.fixed_update does not call this: it runs components from its own flattened
+        dispatch order, so overriding fixed_update() in a GameObject subclass does not change
+        what the scene runs. Inactive subtrees are skipped, as in the scene.
+
+        Args:
+            dt (float): Fixed delta time.
         """
         if not self._active:
             return
 
-        components = self._all_components
-        children = self._all_children
-
-        for comp in components:
+        for comp in self._fixed_update_components:
             if comp.has_started:
                 comp.fixed_update(dt)
-        for child in children:
+        for child in self._children:
             child.fixed_update(dt)
 
-    def render(self, surface) -> None:
-        if not self._active:
-            return
+    def render(self, surface, view: tuple[float, float, float, float] | None = None) -> None:
+        """
+        Render the components of this object and its children directly.
+
+        Scene.render does not call this: it draws components from its own flattened render
+        order, so overriding render() in a GameObject subclass does not change what the scene
+        draws. Subtrees are culled exactly as the scene culls them (see _outside_view).
 
-        sorted_components = self._sorted_components
-        children = self._all_children
+        Args:
+            surface: The pygame surface to render onto.
+            view (tuple | None): World rect (left, top, right, bottom) to cull against. None draws everything.
+        """
+        if not self._active or (view is not None and self._outside_view(view)):
+            return
 
-        for comp in sorted_components:
+        for comp in self._render_components:
             comp.render(surface)
+        for child in self._children:
+            child.render(surface, view)
 
-        for child in children:
-            child.render(surface)
+    def _skips_update(self, visible_objects: set | None) -> bool:
+        """
+        Whether an update pass skips this object and its whole subtree: it is inactive, or it is
+        a non-UI object that the scene found too far from the camera this frame
+        (see Scene._update_visibility). Shared by Scene.update and update().
+
+        Args:
+            visible_objects (set | None): The scene's visible objects. None skips the visibility check.
+        """
+        if not self._active:
+            return True
+        return visible_objects is not None and not self.is_ui_object and self not in visible_objects
+
+    def _outside_view(self, view: tuple[float, float, float, float]) -> bool:
+        """
+        Whether this object's subtree lies entirely outside a world rect (left, top, right, bottom),
+        so rendering can skip it. Shared by Scene.render and render().
+        """
+        left, top, right, bottom = self.get_aabb()
+        return right < view[0] or left > view[2] or bottom < view[1] or top > view[3]
 
     def cleanup(self) -> None:
-        for comp in list(self.runtime_components):
+        for comp in list(self._runtime_components or ()):
             self.remove_component(type(comp))
-        for child in list(self.runtime_children):
+        for child in list(self._runtime_children or ()):
             self.remove_child(child)
             child.cleanup()
+            child._on_remove_recursive()
         for comp in self.initial_components:
             comp.has_started = False
-        self.runtime_components = []
-        self.runtime_children = []
-        self._sort_components()
+        self._runtime_components = None
+        self._runtime_children = None
+        self._refresh_components()
+        self._refresh_children()
 
     def destroy(self):
         """Remove the GameObject from its parent or scene, or deactivate if it's a starting object."""
@@ -277,11 +632,15 @@ class GameObject:
             else:
                 remove_func(self)
 
+        def remove_from_parent(child):
+            child.parent.remove_child(child)
+            child._on_remove_recursive()
+
         if self.parent:
             deactivate_or_remove(
                 container=self.parent,
                 start_list=self.parent.initial_children,
-                remove_func=self.parent.remove_child
+                remove_func=remove_from_parent
             )
         else:
             deactivate_or_remove(
@@ -290,6 +649,13 @@ class GameObject:
                 remove_func=self.scene.remove_game_object
             )
 
+    def _on_remove_recursive(self):
+        """Call on_remove on every component of this GameObject and its descendants, once they leave the scene for good."""
+        for comp in self._components:
+            comp.on_remove()
+        for child in self._children:
+            child._on_remove_recursive()
+
     def enable(self):
         """Enable the GameObject"""
         self._active = True
@@ -304,19 +670,19 @@ class GameObject:
         """
         Called when the GameObject is enabled
         """
-        for comp in self._all_components:
+        for comp in self._components:
             comp.on_enabled()
-        for child in self._all_children:
+        for child in self._children:
             child.on_enabled()
 
     def on_disabled(self):
         """
         Called when the GameObject is disabled
         """
-        for comp in self._all_components:
+        for comp in self._components:
             comp.on_disabled()
             comp.has_started = False
-        for child in self._all_children:
+        for child in self._children:
             child.on_disabled()
 
     def exists(self):
@@ -337,4 +703,4 @@ class GameObject:
         return self.transform.get_world_position()
 
     def __repr__(self):
-        return f"<GameObject id={self.id}, uuid={self.uuid}, name='{self.name}' child_count={len(self._all_children)} active={self._active}>"
+        return f"<GameObject id={self.id}, uuid={self.uuid}, name='{self.name}' child_count={len(self._children)} active={self._active}>"
@@ -0,0 +1,71 @@
+from cogworks.game_object import GameObject
+
+
+class Prefab:
+    """
+    A reusable template for spawning copies of a configured GameObject hierarchy.
+
+    The hierarchy is captured once; every instantiation clones the template with a shallow
+    per-field copy (see GameObject.clone), so loaded surfaces, fonts, sounds and animation
+    definitions are shared between instances instead of being loaded or built again.
+
+    Example:
+        bullet = GameObject("Bullet")
+        bullet.add_component(Sprite("images/bullet.png"))
+        bullet_prefab = Prefab(bullet)
+        scene.instantiate(bullet_prefab, x, y)
+    """
+
+    def __init__(self, game_object: GameObject):
+        """
+        Capture a GameObject hierarchy as a prefab.
+
+        Args:
+            game_object (GameObject): The configured GameObject to copy. The prefab keeps its own
+                copy, so the original can still be used or changed afterwards.
+        """
+        self.template: GameObject = game_object.clone()
+        self.name: str = game_object.name
+
+        # Find out once whether any component field points inside the hierarchy (e.g. a Sprite
+        # captured after start() holds its Transform); if none does, clones skip relinking
+        identity = {}
+        stack = [self.template]
+        while stack:
+            go = stack.pop()
+            identity[id(go)] = go
+            for comp in go.components:
+                identity[id(comp)] = comp
+            stack.extend(go.children)
+        self._relink: bool = self.template._relink_clones(identity) > 0
+
+    def instantiate(
+        self,
+        x: float | None = None,
+        y: float | None = None,
+        rotation: float | None = None
+    ) -> GameObject:
+        """
+        Create a new, detached copy of the template.
+
+        Args:
+            x (float | None): Local x position of the copy. Defaults to the template's.
+            y (float | None): Local y position of the copy. Defaults to the template's.
+            rotation (float | None): Local rotation of the copy in degrees. Defaults to the template's.
+
+        Returns:
+            GameObject: The copy, ready to be added to a scene.
+        """
+        game_object = self.template.clone(relink=self._relink)
+        transform = game_object.transform
+        # start() resets the local values to the start values, so both are set
+        if x is not None:
+            transform.start_x = transform._local_x = x
+        if y is not None:
+            transform.start_y = transform._local_y = y
+        if rotation is not None:
+            transform.start_rotation = transform._local_rotation = rotation
+        return game_object
+
+    def __repr__(self):
+        return f"<Prefab name='{self.name}'>"
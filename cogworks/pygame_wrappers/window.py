@@ -1,4 +1,4 @@
-from cogworks.utils.asset_loader import load_engine_image
+from cogworks.utils.asset_loader import image_cache, load_engine_image
 
 
 class Window:
@@ -45,7 +45,10 @@ class Window:
         self.screen = self._create_window()
 
     def _create_window(self):
-        """Internal helper to create the pygame window with the current settings."""
+        """
+        Internal helper to create the pygame window with the current settings.
+        Cached images are converted again if the new display mode has another pixel format.
+        """
         flags = 0
         if self.resizable:
             flags |= self.pygame.RESIZABLE
@@ -54,6 +57,7 @@ class Window:
 
         self.pygame.display.set_caption(self.caption)
         screen = self.pygame.display.set_mode((self.width, self.height), flags)
+        image_cache.reconvert()
         icon = load_engine_image("images/cog_works_icon_2.png")
         self.pygame.display.set_icon(icon)
         return screen
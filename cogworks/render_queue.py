@@ -0,0 +1,77 @@
+import pygame
+
+from cogworks.utils.asset_loader import apply_alpha
+
+
+class RenderQueue:
+    """
+    Collects blit commands during a scene's render phase and draws them in batches with a
+    single pygame.Surface.blits call, instead of one Python-level blit per sprite.
+
+    Commands are drawn in submission order. The scene submits in draw order already
+    (z_index, then hierarchy, then component z_index), so no sorting is needed. A component
+    that draws directly onto the surface (debug shapes, UI, lines) makes the scene flush the
+    queue first, so it still ends up above everything submitted before it.
+
+    Images shared between sprites (through the zoom and rotation caches) are drawn with
+    different alphas, but a surface only holds one alpha at a time. Commands therefore carry
+    their alpha, and resubmitting a queued surface with another alpha flushes the queue first.
+    """
+
+    def __init__(self):
+        """Initialise an empty, inactive render queue."""
+        self.active = False  # True while the scene is rendering; submit() is only valid then
+        self._commands: list[tuple] = []
+        self._alphas: dict[pygame.Surface, int] = {}  # Alpha each queued source must be drawn with
+        self._target: pygame.Surface | None = None
+        self.batches = 0  # Number of blits calls made since the queue was created
+        self.commands = 0  # Number of commands drawn since the queue was created
+
+    def begin(self, surface: pygame.Surface) -> None:
+        """Start collecting commands for a frame drawn onto a surface."""
+        self._commands.clear()
+        self._alphas.clear()
+        self._target = surface
+        self.active = True
+
+    def submit(self, source: pygame.Surface, dest, area=None, special_flags: int = 0, alpha: int | None = None) -> None:
+        """
+        Queue a blit.
+
+        Args:
+            source (pygame.Surface): Image to draw.
+            dest: Top-left position (x, y) or rect on the target surface.
+            area (pygame.Rect | None): Part of the source to draw. None draws all of it.
+            special_flags (int): pygame blend flags.
+            alpha (int | None): Whole-surface alpha to draw the source with. None leaves the source's alpha as it is.
+        """
+        if alpha is not None:
+            queued_alpha = self._alphas.get(source)
+            if queued_alpha != alpha:
+                if queued_alpha is not None:
+                    self.flush(self._target)  # Earlier blits of this source still need its old alpha
+                self._alphas[source] = alpha
+                apply_alpha(source, alpha)
+        if area is None and not special_flags:
+            self._commands.append((source, dest))
+        else:
+            self._commands.append((source, dest, area, special_flags))
+
+    def flush(self, surface: pygame.Surface) -> None:
+        """Draw every queued command onto a surface, in submission order."""
+        commands = self._commands
+        if commands:
+            surface.blits(commands, doreturn=False)
+            self.batches += 1
+            self.commands += len(commands)
+            commands.clear()
+        self._alphas.clear()
+
+    def end(self, surface: pygame.Surface) -> None:
+        """Draw the remaining commands and stop collecting."""
+        self.flush(surface)
+        self.active = False
+        self._target = None
+
+    def __len__(self) -> int:
+        return len(self._commands)
@@ -1,9 +1,17 @@
+import math
+
 import pymunk
 from operator import attrgetter
 
 from cogworks.components.audio_listener import AudioListener
 from cogworks.components.camera import Camera
 from cogworks.game_object import GameObject
+from cogworks.prefab import Prefab
+from cogworks.render_queue import RenderQueue
+from cogworks.spatial_index import SpatialIndex
+from cogworks.static_layer import StaticLayer
+from cogworks.transform_hierarchy import TransformHierarchy
+from cogworks.transform_store import TransformStore
 from cogworks.trigger_collision_manager import TriggerCollisionManager
 
 
@@ -14,12 +22,13 @@ class Scene:
     Each Scene has its own camera GameObject by default.
     """
 
-    def __init__(self, name: str = "Scene", gravity=(0, 900)):
+    def __init__(self, name: str = "Scene", gravity=(0, 900), use_transform_store: bool = False):
         """
         Initialize a Scene with a name and default camera.
 
         Args:
             name (str): The name of the scene.
+            use_transform_store (bool): Keep transforms in an array-backed TransformStore (requires NumPy).
         """
         self.has_started = False
         self.start_states = None
@@ -27,12 +36,33 @@ class Scene:
 
         self.engine = None
 
+        # Batched world transform updates
+        self.transform_hierarchy = TransformHierarchy()
+        self.transform_store = TransformStore() if use_transform_store else None
+
+        # World bounds per GameObject layer, overriding the engine's bounds
+        self.layer_world_bounds: dict[str, tuple[float, float]] = {}
+
+        # Non-UI GameObjects close enough to the camera view to be updated this frame. Objects added
+        # to the scene join it straight away, until the next update works out what is near the camera
+        self.visible_objects: set[GameObject] = set()
+        self.update_margin: float = 2000.0  # World units beyond the view in which objects keep updating
+        self.render_margin: float = 500.0  # World units beyond the view before whole subtrees are culled
+        self.render_queue = RenderQueue()  # Batches sprite blits during render()
+        self.static_chunk_size: int = 512  # Screen pixels per side of a StaticLayer chunk
+
+        # Spatial queries over GameObject bounds (query_rect, query_radius, nearest, raycast)
+        self.spatial_index = SpatialIndex()
+
         # Default camera setup
         self.camera = GameObject("Camera")
         self.camera_component = Camera()
         self.camera.add_component(self.camera_component)
         self.camera.add_component(AudioListener())
         self.camera.scene = self
+        if self.transform_store is not None:
+            self.transform_store.bind_hierarchy(self.camera)
+        self.spatial_index.insert(self.camera)
 
         self.initial_objects: list[GameObject] = [self.camera]
         self.runtime_objects: list[GameObject] = []
@@ -40,17 +70,38 @@ class Scene:
         # Cache combined sorted list for updates and rendering
         self.sorted_objects: list[GameObject] = self.initial_objects + self.runtime_objects
 
+        # Whole hierarchy flattened in traversal order, with each entry's depth and the index just past its
+        # subtree, plus one pruned (objects, subtree ends) pair per phase; rebuilt when marked dirty.
+        # The render order also holds each object's components drawn per frame, and the static layers
+        # with the index of the object each is drawn before (see _flatten_render)
+        self._hierarchy: list[GameObject] = []
+        self._hierarchy_depths: list[int] = []
+        self._hierarchy_ends: list[int] = []
+        self._update_order: tuple[list[GameObject], list[int]] = ([], [])
+        self._fixed_update_order: tuple[list[GameObject], list[int]] = ([], [])
+        self._render_order: tuple[list[GameObject], list[int], list[list], list[tuple[int, StaticLayer]]] = ([], [], [], [])
+        self._static_layer_of: dict = {}  # Baked component -> its StaticLayer
+        self._dispatch_dirty = True
+
         self.physics_space = pymunk.Space()
         self.gravity = gravity
         self.physics_space.gravity = self.gravity
         self.trigger_collision_manager = TriggerCollisionManager()
 
+        # Physics objects and trigger colliders collected while starting a batch of GameObjects, else None
+        self._physics_batch: list | None = None
+        self._trigger_batch: list | None = None
+
     def start(self):
         self.has_started = True
         # Start each initial game object
-        for go in self.initial_objects:
-            go.enable()
-            go.start()
+        self._begin_registration_batch()
+        try:
+            for go in self.initial_objects:
+                go.enable()
+                go.start()
+        finally:
+            self._end_registration_batch()
         self._sort_objects()
 
     def stop(self):
@@ -64,10 +115,11 @@ class Scene:
         self.physics_space = pymunk.Space()
         self.physics_space.gravity = self.gravity
 
-        # Destroy and cleanup runtime GameObjects
-        for go in self.runtime_objects:
-            go.destroy()
+        # Cleanup and destroy runtime GameObjects. Cleanup first removes their runtime components
+        # and children, so destroying them calls on_remove on each remaining component only once
+        for go in list(self.runtime_objects):
             go.cleanup()
+            go.destroy()
         self.runtime_objects.clear()
 
         # Disable and clean up initial GameObjects
@@ -77,6 +129,7 @@ class Scene:
 
         # Clear collision manager
         self.trigger_collision_manager.clear()
+        self.transform_hierarchy.clear()
 
         self._sort_objects()  # refresh sorted_objects
 
@@ -93,7 +146,10 @@ class Scene:
         """
         if self.has_started:
             raise RuntimeError("Scene already started, use instantiate_game_object instead")
-        game_object.scene = self
+        game_object._set_scene_recursive(self)
+        if self.transform_store is not None:
+            self.transform_store.bind_hierarchy(game_object)
+        self.spatial_index.insert_hierarchy(game_object)
         self.initial_objects.append(game_object)
         self._sort_objects()
 
@@ -106,26 +162,144 @@ class Scene:
         """
         if not self.has_started:
             raise RuntimeError("Scene hasn't started, use add_game_object instead")
-        game_object.scene = self
+        game_object._set_scene_recursive(self)
+        if self.transform_store is not None:
+            self.transform_store.bind_hierarchy(game_object)
+        self.spatial_index.insert_hierarchy(game_object)
         game_object.start()
         self.runtime_objects.append(game_object)
         self._sort_objects()
 
+    def instantiate_many(self, game_objects: list[GameObject]) -> None:
+        """
+        Instantiate several *runtime GameObjects at once, e.g. a spawn wave or a loaded chunk.
+
+        Every object is started as with instantiate_game_object, but the scene's ordered
+        containers are merged and sorted once, and all physics bodies and trigger colliders
+        created while starting are registered in a single batch.
+
+        Args:
+            game_objects (list[GameObject]): The GameObjects to add.
+        """
+        if not self.has_started:
+            raise RuntimeError("Scene hasn't started, use add_game_object instead")
+        game_objects = list(game_objects)
+        if not game_objects:
+            return
+
+        for game_object in game_objects:
+            game_object._set_scene_recursive(self)
+            if self.transform_store is not None:
+                self.transform_store.bind_hierarchy(game_object)
+            self.spatial_index.insert_hierarchy(game_object)
+
+        self._begin_registration_batch()
+        try:
+            for game_object in game_objects:
+                game_object.start()
+        finally:
+            self._end_registration_batch()
+
+        self.runtime_objects.extend(game_objects)
+        self._sort_objects()
+
+    def instantiate(
+        self,
+        prefab: Prefab,
+        x: float | None = None,
+        y: float | None = None,
+        rotation: float | None = None
+    ) -> GameObject:
+        """
+        Spawn a copy of a prefab into the scene. Before the scene starts the copy is added as an
+        initial GameObject, afterwards it is instantiated as a runtime GameObject.
+
+        Args:
+            prefab (Prefab): The prefab to copy.
+            x (float | None): Position of the copy. Defaults to the prefab's.
+            y (float | None): Position of the copy. Defaults to the prefab's.
+            rotation (float | None): Rotation of the copy in degrees. Defaults to the prefab's.
+
+        Returns:
+            GameObject: The spawned GameObject.
+        """
+        game_object = prefab.instantiate(x, y, rotation)
+        if self.has_started:
+            self.instantiate_game_object(game_object)
+        else:
+            self.add_game_object(game_object)
+        return game_object
+
     def remove_game_object(self, game_object: GameObject) -> None:
         """
-        Remove a *runtime GameObject from the scene and call `on_remove` on its components.
+        Remove a *runtime GameObject from the scene and call `on_remove` on the components
+        of it and its descendants.
 
         Args:
             game_object (GameObject): The GameObject to remove.
         """
         if game_object in self.runtime_objects:
-            for comp in game_object.components:
-                if hasattr(comp, "on_remove"):
-                    comp.on_remove()
+            game_object._on_remove_recursive()
             self.runtime_objects.remove(game_object)
+            if self.transform_store is not None:
+                self.transform_store.release_hierarchy(game_object)
+            self.spatial_index.remove_hierarchy(game_object)
             del game_object
             self._sort_objects()
 
+    def add_physics_objects(self, *objects) -> None:
+        """
+        Add bodies, shapes or constraints to the physics space, deferred to the end of
+        the current batch while GameObjects are being started in bulk.
+
+        Args:
+            *objects: pymunk bodies, shapes or constraints.
+        """
+        if self._physics_batch is not None:
+            self._physics_batch.extend(objects)
+        else:
+            self.physics_space.add(*objects)
+
+    def remove_physics_objects(self, *objects) -> None:
+        """
+        Remove bodies, shapes or constraints added with add_physics_objects, including
+        ones still waiting to be added at the end of the current batch.
+
+        Args:
+            *objects: pymunk bodies, shapes or constraints.
+        """
+        batch = self._physics_batch
+        for obj in objects:
+            if obj.space is not None:
+                obj.space.remove(obj)
+            elif batch is not None and obj in batch:
+                batch.remove(obj)
+
+    def register_trigger_collider(self, collider) -> None:
+        """
+        Register a trigger collider with the collision manager, deferred to the end of
+        the current batch while GameObjects are being started in bulk.
+
+        Args:
+            collider (TriggerCollider): The collider to register.
+        """
+        if self._trigger_batch is not None:
+            self._trigger_batch.append(collider)
+        else:
+            self.trigger_collision_manager.register(collider)
+
+    def _begin_registration_batch(self):
+        self._physics_batch = []
+        self._trigger_batch = []
+
+    def _end_registration_batch(self):
+        physics_batch, trigger_batch = self._physics_batch, self._trigger_batch
+        self._physics_batch = self._trigger_batch = None
+        if physics_batch:
+            self.physics_space.add(*physics_batch)
+        if trigger_batch:
+            self.trigger_collision_manager.register_many(trigger_batch)
+
     def get_all_components_of_type(self, component_type):
         components = []
         for go in self.sorted_objects:
@@ -139,8 +313,27 @@ class Scene:
         Args:
             dt (float): Delta time since last frame.
         """
-        for obj in self.sorted_objects:
-            obj.update(dt)
+        self._update_transforms()
+        if self._dispatch_dirty:
+            self._rebuild_dispatch()
+        self._update_visibility()
+
+        if self._dispatch_dirty:
+            self._rebuild_dispatch()  # Objects culled by _update_visibility left the hierarchy
+
+        # Components are called from the flat dispatch order; GameObject.update is not called
+        objects, ends = self._update_order
+        visible = self.visible_objects
+        i, count = 0, len(objects)
+        while i < count:
+            go = objects[i]
+            if go._skips_update(visible):
+                i = ends[i]  # Skip the whole subtree
+                continue
+            for comp in go._update_components:
+                if comp.has_started:
+                    comp.update(dt)
+            i += 1
 
         self.trigger_collision_manager.update(dt)
 
@@ -154,8 +347,20 @@ class Scene:
         """
         self.physics_space.step(dt)
 
-        for obj in self.sorted_objects:
-            obj.fixed_update(dt)
+        if self._dispatch_dirty:
+            self._rebuild_dispatch()
+
+        objects, ends = self._fixed_update_order
+        i, count = 0, len(objects)
+        while i < count:
+            go = objects[i]
+            if not go._active:
+                i = ends[i]
+                continue
+            for comp in go._fixed_update_components:
+                if comp.has_started:
+                    comp.fixed_update(dt)
+            i += 1
 
     def render(self, surface) -> None:
         """
@@ -164,13 +369,207 @@ class Scene:
         Args:
             surface: The pygame surface to render onto.
         """
-        for obj in self.sorted_objects:
-            obj.render(surface)
+        if self._dispatch_dirty:
+            self._rebuild_dispatch()
+
+        self._update_transforms()
+
+        # The camera may have moved since update
+        camera = self.camera_component
+        camera.begin_frame()
+        top, bottom, left, right = camera.get_bounds()
+        margin = self.render_margin
+        view = (left - margin, top - margin, right + margin, bottom + margin)
+
+        zoom = camera.zoom
+        queue = self.render_queue
+        queue.begin(surface)
+        try:
+            objects, ends, components, layers = self._render_order
+            i, count = 0, len(objects)
+            layer_index, layer_count = 0, len(layers)
+            while i < count:
+                if layer_index < layer_count and layers[layer_index][0] <= i:
+                    layers[layer_index][1].render(queue, surface, left, top, zoom)
+                    layer_index += 1
+                    continue
+                go = objects[i]
+                if not go._active:
+                    i = ends[i]
+                    continue
+                if go._outside_view(view):
+                    i = ends[i]  # Whole subtree is off screen
+                    continue
+                for comp in components[i]:
+                    if not comp.queued_render:
+                        queue.flush(surface)  # Keep draw order with components that draw directly
+                    comp.render(surface)
+                i += 1
+            while layer_index < layer_count:
+                layers[layer_index][1].render(queue, surface, left, top, zoom)
+                layer_index += 1
+        finally:
+            queue.end(surface)
+
+    def _update_transforms(self):
+        """Bring all dirty world transforms up to date in bulk before objects read them."""
+        if self.transform_store is not None:
+            self.transform_store.update_world()
+        self.transform_hierarchy.update()
+
+    def set_layer_world_bounds(self, layer: str, bound_x: float = math.inf, bound_y: float | None = None) -> None:
+        """
+        Override the world bounds for every GameObject on a layer. Call with only the layer
+        name to exempt it entirely, e.g. for static level geometry.
+
+        Args:
+            layer (str): The GameObject layer.
+            bound_x (float): Maximum absolute world x position.
+            bound_y (float | None): Maximum absolute world y position. Defaults to bound_x.
+        """
+        self.layer_world_bounds[layer] = (bound_x, bound_y if bound_y is not None else bound_x)
+        if self.engine is None:
+            return
+        stack = list(self.sorted_objects)
+        while stack:
+            go = stack.pop()
+            if go.layer == layer:
+                go.transform.world_bound_x, go.transform.world_bound_y = self.get_world_bounds(go)
+            stack.extend(go.children)
+
+    def get_world_bounds(self, game_object: GameObject) -> tuple[float, float]:
+        """
+        Resolve the world bounds of a GameObject: its own override, then its layer's, then the engine's.
+
+        Returns:
+            tuple[float, float]: Maximum absolute world x and y positions.
+        """
+        if game_object.world_bounds is not None:
+            return game_object.world_bounds
+        bounds = self.layer_world_bounds.get(game_object.layer)
+        if bounds is not None:
+            return bounds
+        return self.engine.world_bound_x, self.engine.world_bound_y
+
+    def _update_visibility(self):
+        """
+        Walk the flattened hierarchy once per frame to both cull and classify GameObjects:
+
+        - every active, non-UI GameObject whose world position lies outside its world bounds is
+          destroyed (after the walk, so the hierarchy is not modified while it is walked). Objects
+          with infinite bounds are skipped without computing their world position;
+        - every active non-UI GameObject whose own box (its position and what its components draw,
+          see GameObject.get_own_aabb) comes within update_margin of the camera view is collected
+          into visible_objects, so large objects such as tilemaps count as near the camera as soon
+          as any part of them is. Scene.update skips objects outside
+          this set, along with their children. UI objects are always updated, but their children
+          are still tested.
+
+        Subtree boxes let whole subtrees be classified without testing each object: a subtree
+        wholly outside the view is hidden, one wholly inside it is visible.
+        """
+        camera = self.camera_component
+        camera.begin_frame()
+        top, bottom, left, right = camera.get_bounds()
+        margin = self.update_margin
+        top, bottom, left, right = top - margin, bottom + margin, left - margin, right + margin
+
+        inf = math.inf
+        objects, ends = self._hierarchy, self._hierarchy_ends
+        visible = set()
+        out_of_bounds = []
+        inside_end = hidden_end = 0  # Entries before these indices are in a subtree wholly inside / outside the view
+        i, count = 0, len(objects)
+        while i < count:
+            go = objects[i]
+            if not go._active:
+                i = ends[i]
+                continue
+
+            ui = go.is_ui_object
+            transform = go.transform
+            if not ui and (transform.world_bound_x != inf or transform.world_bound_y != inf):
+                x, y = transform.get_world_position()
+                if abs(x) > transform.world_bound_x or abs(y) > transform.world_bound_y:
+                    out_of_bounds.append(go)
+                    hidden_end = max(hidden_end, ends[i])  # Its descendants are still bounds checked
+
+            if i < hidden_end:
+                pass
+            elif i < inside_end:
+                if not ui:
+                    visible.add(go)
+            else:
+                box_left, box_top, box_right, box_bottom = go.get_aabb()
+                if box_right < left or box_left > right or box_bottom < top or box_top > bottom:
+                    hidden_end = ends[i]
+                elif box_left >= left and box_right <= right and box_top >= top and box_bottom <= bottom:
+                    inside_end = ends[i]
+                    if not ui:
+                        visible.add(go)
+                elif not ui:
+                    own_left, own_top, own_right, own_bottom = go.get_own_aabb()
+                    if own_right < left or own_left > right or own_bottom < top or own_top > bottom:
+                        hidden_end = ends[i]
+                    else:
+                        visible.add(go)
+            i += 1
+        self.visible_objects = visible
+
+        for go in out_of_bounds:
+            go.destroy()
 
     def _sort_objects(self):
         # Sort game objects by z_index (default 0)
         self.sorted_objects = self.initial_objects + self.runtime_objects
         self.sorted_objects.sort(key=attrgetter("z_index"))
+        self._dispatch_dirty = True
+
+    def _rebuild_dispatch(self):
+        """
+        Flatten the hierarchy into pre-ordered arrays: sorted root objects, each followed by its
+        descendants, depth first. ends[i] is the index just past entry i's subtree, so a phase loop
+        can skip a disabled or culled subtree with a single jump instead of recursing.
+
+        Each phase also gets its own arrays, leaving out subtrees in which no component
+        does work in that phase. Static layers whose members are unchanged are kept, along
+        with their baked chunks.
+        """
+        self._hierarchy, self._hierarchy_depths, self._hierarchy_ends = _flatten(self.sorted_objects)
+        self._update_order = _flatten_phase(self.sorted_objects, "_update_components")
+        self._fixed_update_order = _flatten_phase(self.sorted_objects, "_fixed_update_components")
+
+        previous_layers = {tuple(layer.components): layer for _, layer in self._render_order[3]}
+        self._render_order = _flatten_render(self.sorted_objects, previous_layers, self.static_chunk_size)
+        self._static_layer_of = {comp: layer for _, layer in self._render_order[3] for comp in layer.components}
+        self._dispatch_dirty = False
+
+    def invalidate_static(self, game_object: GameObject) -> None:
+        """
+        Re-bake the static layer chunks around a static GameObject.
+        Called automatically when its transform, image or active state changes; call it after
+        changing anything else its sprites draw (e.g. their offsets).
+
+        Args:
+            game_object (GameObject): The static GameObject that changed.
+        """
+        layer_of = self._static_layer_of
+        if layer_of:
+            for comp in game_object._render_components:
+                layer = layer_of.get(comp)
+                if layer is not None:
+                    layer.invalidate(comp)
+
+    def iter_hierarchy(self):
+        """
+        Iterate over every GameObject in the scene in update and render order, parents before children.
+
+        Yields:
+            tuple[GameObject, int]: Each GameObject and its depth (0 for root objects).
+        """
+        if self._dispatch_dirty:
+            self._rebuild_dispatch()
+        return zip(self._hierarchy, self._hierarchy_depths)
 
     def get_window_size(self) -> tuple[int, int]:
         """
@@ -188,6 +587,103 @@ class Scene:
         return f"<Scene name='{self.name}', objects={len(self.sorted_objects)}>"
 
 
+def _flatten(roots: list[GameObject]) -> tuple[list[GameObject], list[int], list[int]]:
+    """Return the pre-ordered objects, depths and subtree ends of the hierarchies under roots."""
+    objects, depths, ends = [], [], []
+
+    def visit(go: GameObject, depth: int):
+        index = len(objects)
+        objects.append(go)
+        depths.append(depth)
+        ends.append(0)
+        for child in go._children:
+            visit(child, depth + 1)
+        ends[index] = len(objects)
+
+    for root in roots:
+        visit(root, 0)
+    return objects, depths, ends
+
+
+def _flatten_phase(roots: list[GameObject], dispatch_attr: str) -> tuple[list[GameObject], list[int]]:
+    """
+    Return the pre-ordered objects and subtree ends of the hierarchies under roots,
+    leaving out subtrees with no components in the given dispatch list.
+    """
+    objects, ends = [], []
+
+    def visit(go: GameObject):
+        index = len(objects)
+        objects.append(go)
+        ends.append(0)
+        for child in go._children:
+            visit(child)
+        if len(objects) == index + 1 and not getattr(go, dispatch_attr):
+            del objects[index], ends[index]  # Nothing to do anywhere in this subtree
+        else:
+            ends[index] = len(objects)
+
+    for root in roots:
+        visit(root)
+    return objects, ends
+
+
+def _flatten_render(
+    roots: list[GameObject],
+    previous_layers: dict[tuple, StaticLayer],
+    chunk_size: int
+) -> tuple[list[GameObject], list[int], list[list], list[tuple[int, StaticLayer]]]:
+    """
+    Return the render order: the objects and subtree ends as _flatten_phase would, each object's
+    components to render every frame, and the static layers with the index of the object each is
+    drawn before.
+
+    Bakeable components of static, non-UI GameObjects are baked into static layers instead. Those
+    consecutive in draw order share a layer, so static scenery between other objects keeps its
+    place, and a layer with the same members as one in previous_layers reuses it. Objects left with
+    nothing to render every frame are left out like empty subtrees.
+    """
+    objects, ends, components, layers = [], [], [], []
+    run = []
+
+    def close_run(index: int):
+        members = tuple(run)
+        layer = previous_layers.get(members)
+        if layer is None or layer.chunk_size != chunk_size:
+            layer = StaticLayer(list(members), chunk_size)
+        layers.append((index, layer))
+        run.clear()
+
+    def visit(go: GameObject):
+        index = len(objects)
+        if go._static and not go.is_ui_object:
+            live = []
+            for comp in go._render_components:
+                if comp.bakeable:
+                    run.append(comp)
+                else:
+                    live.append(comp)
+        else:
+            live = go._render_components
+        if live and run:
+            close_run(index)
+        objects.append(go)
+        ends.append(0)
+        components.append(live)
+        for child in go._children:
+            visit(child)
+        if len(objects) == index + 1 and not live:
+            del objects[index], ends[index], components[index]  # Nothing to do anywhere in this subtree
+        else:
+            ends[index] = len(objects)
+
+    for root in roots:
+        visit(root)
+    if run:
+        close_run(len(objects))
+    return objects, ends, components, layers
+
+
 class SceneManager:
     """
     SceneManager handles adding, switching, and updating the currently active scene.
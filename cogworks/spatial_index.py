@@ -0,0 +1,395 @@
+import heapq
+import math
+from collections import defaultdict
+
+
+class SpatialIndex:
+    """
+    Scene-wide spatial hash over GameObject bounds.
+
+    Every GameObject in the scene is stored in the grid cells overlapped by its own bounding box
+    (its position plus what its components draw, see GameObject.get_own_aabb). Objects are marked
+    when their box is invalidated and only those are re-bucketed, lazily, before the next query,
+    so queries cost O(cells visited + results) instead of a scan over every object.
+
+    Objects whose components draw an unbounded area (UI, backgrounds) are indexed by their position.
+    Objects covering more than max_cells_per_object cells are kept in a separate list that every
+    query checks.
+    """
+
+    def __init__(self, cell_size: float = 128, max_cells_per_object: int = 64):
+        """
+        Initialise the spatial index.
+
+        Args:
+            cell_size (float): Size of each grid cell in world units.
+            max_cells_per_object (int): Objects overlapping more cells than this are not bucketed.
+        """
+        self.cell_size = cell_size
+        self.max_cells_per_object = max_cells_per_object
+
+        self.cells = defaultdict(set)  # (cx, cy) -> GameObjects whose box overlaps the cell
+        self._boxes = {}  # GameObject -> (left, top, right, bottom) last indexed
+        self._ranges = {}  # GameObject -> (x1, y1, x2, y2) cell range, or None for large objects
+        self._large = set()
+        self._pending = set()
+
+        # Occupied cell range, only ever grown; bounds ray marching and nearest-neighbour rings
+        self._cell_bounds = None
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __contains__(self, game_object) -> bool:
+        return game_object in self._boxes
+
+    # ---------------- Maintenance ----------------
+    def insert(self, game_object) -> None:
+        """Add a GameObject to the index. Its box is computed before the next query."""
+        if game_object not in self._boxes:
+            self._boxes[game_object] = None
+            self._ranges[game_object] = None
+        self._pending.add(game_object)
+
+    def remove(self, game_object) -> None:
+        """Remove a GameObject from the index."""
+        if game_object not in self._boxes:
+            return
+        self._unbucket(game_object)
+        del self._boxes[game_object]
+        del self._ranges[game_object]
+        self._pending.discard(game_object)
+
+    def insert_hierarchy(self, game_object) -> None:
+        """Add a GameObject and all its descendants."""
+        self.insert(game_object)
+        for child in game_object.children:
+            self.insert_hierarchy(child)
+
+    def remove_hierarchy(self, game_object) -> None:
+        """Remove a GameObject and all its descendants."""
+        self.remove(game_object)
+        for child in game_object.children:
+            self.remove_hierarchy(child)
+
+    def mark_moved(self, game_object) -> None:
+        """Queue a GameObject whose bounding box may have changed."""
+        self._pending.add(game_object)
+
+    def refresh(self) -> None:
+        """Re-bucket every GameObject marked since the last refresh. Called by each query."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, set()
+        boxes = self._boxes
+        for game_object in pending:
+            if game_object in boxes:
+                self._rebucket(game_object)
+
+    def clear(self) -> None:
+        """Remove every GameObject from the index."""
+        self.cells.clear()
+        self._boxes.clear()
+        self._ranges.clear()
+        self._large.clear()
+        self._pending.clear()
+        self._cell_bounds = None
+
+    def _rebucket(self, game_object):
+        left, top, right, bottom = game_object.get_own_aabb()
+        if math.isinf(left) or math.isinf(top) or math.isinf(right) or math.isinf(bottom):
+            left, top = right, bottom = game_object.transform.get_world_position()
+        self._boxes[game_object] = (left, top, right, bottom)
+
+        size = self.cell_size
+        x1, y1 = math.floor(left / size), math.floor(top / size)
+        x2, y2 = math.floor(right / size), math.floor(bottom / size)
+        if (x2 - x1 + 1) * (y2 - y1 + 1) > self.max_cells_per_object:
+            cell_range = None
+        else:
+            cell_range = (x1, y1, x2, y2)
+
+        old_range = self._ranges[game_object]
+        if cell_range == old_range and (cell_range is not None or game_object in self._large):
+            return
+
+        self._unbucket(game_object)
+        self._ranges[game_object] = cell_range
+        if cell_range is None:
+            self._large.add(game_object)
+            return
+
+        cells = self.cells
+        for cx in range(x1, x2 + 1):
+            for cy in range(y1, y2 + 1):
+                cells[(cx, cy)].add(game_object)
+
+        bounds = self._cell_bounds
+        if bounds is None:
+            self._cell_bounds = cell_range
+        elif x1 < bounds[0] or y1 < bounds[1] or x2 > bounds[2] or y2 > bounds[3]:
+            self._cell_bounds = (min(x1, bounds[0]), min(y1, bounds[1]), max(x2, bounds[2]), max(y2, bounds[3]))
+
+    def _unbucket(self, game_object):
+        cell_range = self._ranges.get(game_object)
+        if cell_range is None:
+            self._large.discard(game_object)
+            return
+        x1, y1, x2, y2 = cell_range
+        cells = self.cells
+        for cx in range(x1, x2 + 1):
+            for cy in range(y1, y2 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(game_object)
+                    if not bucket:
+                        del cells[(cx, cy)]
+        self._ranges[game_object] = None
+
+    @staticmethod
+    def _accepts(game_object, layer_mask) -> bool:
+        return game_object._active and (not layer_mask or game_object.layer in layer_mask)
+
+    # ---------------- Queries ----------------
+    def query_rect(self, left: float, top: float, right: float, bottom: float, layer_mask=None) -> list:
+        """
+        Return the active GameObjects whose bounding box overlaps a world-space rectangle.
+
+        Args:
+            left (float): Left edge of the rectangle.
+            top (float): Top edge of the rectangle.
+            right (float): Right edge of the rectangle.
+            bottom (float): Bottom edge of the rectangle.
+            layer_mask (Optional[List[str]]): Only return GameObjects on these layers. None means all layers.
+
+        Returns:
+            list[GameObject]: The overlapping GameObjects, in no particular order.
+        """
+        self.refresh()
+        candidates = set(self._large)
+
+        bounds = self._cell_bounds
+        if bounds is not None:
+            # Clip the rectangle to the occupied cells (this also handles infinite rectangles)
+            size = self.cell_size
+            x1 = math.floor(max(left, bounds[0] * size) / size)
+            y1 = math.floor(max(top, bounds[1] * size) / size)
+            x2 = math.floor(min(right, bounds[2] * size) / size)
+            y2 = math.floor(min(bottom, bounds[3] * size) / size)
+
+            cells = self.cells
+            if (x2 - x1 + 1) * (y2 - y1 + 1) > len(cells):
+                for (cx, cy), bucket in cells.items():
+                    if x1 <= cx <= x2 and y1 <= cy <= y2:
+                        candidates.update(bucket)
+            else:
+                for cx in range(x1, x2 + 1):
+                    for cy in range(y1, y2 + 1):
+                        bucket = cells.get((cx, cy))
+                        if bucket:
+                            candidates.update(bucket)
+
+        boxes = self._boxes
+        result = []
+        for game_object in candidates:
+            b_left, b_top, b_right, b_bottom = boxes[game_object]
+            if b_right < left or b_left > right or b_bottom < top or b_top > bottom:
+                continue
+            if self._accepts(game_object, layer_mask):
+                result.append(game_object)
+        return result
+
+    def query_radius(self, x: float, y: float, radius: float, layer_mask=None) -> list:
+        """
+        Return the active GameObjects whose bounding box lies within a radius of a world point.
+
+        Args:
+            x (float): World x-coordinate of the centre.
+            y (float): World y-coordinate of the centre.
+            radius (float): Search radius in world units.
+            layer_mask (Optional[List[str]]): Only return GameObjects on these layers. None means all layers.
+
+        Returns:
+            list[GameObject]: The GameObjects in range, in no particular order.
+        """
+        radius_sq = radius * radius
+        boxes = self._boxes
+        return [
+            go for go in self.query_rect(x - radius, y - radius, x + radius, y + radius, layer_mask)
+            if self._distance_sq(boxes[go], x, y) <= radius_sq
+        ]
+
+    def nearest(self, x: float, y: float, k: int = 1, max_distance: float = math.inf, layer_mask=None) -> list:
+        """
+        Return up to k active GameObjects closest to a world point, nearest first.
+        Distance is measured to each GameObject's bounding box (0 when the point is inside it).
+
+        Args:
+            x (float): World x-coordinate of the query point.
+            y (float): World y-coordinate of the query point.
+            k (int): Maximum number of GameObjects to return.
+            max_distance (float): Ignore GameObjects further away than this.
+            layer_mask (Optional[List[str]]): Only return GameObjects on these layers. None means all layers.
+
+        Returns:
+            list[GameObject]: The nearest GameObjects, nearest first.
+        """
+        self.refresh()
+        if k <= 0:
+            return []
+
+        boxes = self._boxes
+        max_distance_sq = max_distance * max_distance
+        seen = set()
+        found = []  # (distance_sq, id, GameObject)
+
+        def consider(candidates):
+            for game_object in candidates:
+                if game_object in seen:
+                    continue
+                seen.add(game_object)
+                if not self._accepts(game_object, layer_mask):
+                    continue
+                distance_sq = self._distance_sq(boxes[game_object], x, y)
+                if distance_sq <= max_distance_sq:
+                    found.append((distance_sq, id(game_object), game_object))
+
+        consider(self._large)
+
+        bounds = self._cell_bounds
+        if bounds is not None:
+            size = self.cell_size
+            qx, qy = math.floor(x / size), math.floor(y / size)
+            max_ring = max(qx - bounds[0], bounds[2] - qx, qy - bounds[1], bounds[3] - qy, 0)
+            cells = self.cells
+            ring = 0
+            while ring <= max_ring:
+                if (2 * ring + 1) ** 2 > 4 * len(cells):
+                    # Rings are now larger than the occupied grid, so scan the rest directly
+                    for bucket in cells.values():
+                        consider(bucket)
+                    break
+                for cell in self._ring_cells(qx, qy, ring):
+                    bucket = cells.get(cell)
+                    if bucket:
+                        consider(bucket)
+                # Objects not seen yet lie entirely outside the visited square
+                reach = ring * size
+                if reach * reach > max_distance_sq:
+                    break
+                if len(found) >= k and heapq.nsmallest(k, found)[-1][0] <= reach * reach:
+                    break
+                ring += 1
+
+        return [game_object for _, _, game_object in heapq.nsmallest(k, found)]
+
+    def raycast(self, x: float, y: float, dx: float, dy: float, max_distance: float = math.inf, layer_mask=None):
+        """
+        Cast a ray through the grid and return the first active GameObject whose bounding box it hits.
+
+        Args:
+            x (float): World x-coordinate of the ray origin.
+            y (float): World y-coordinate of the ray origin.
+            dx (float): X component of the ray direction.
+            dy (float): Y component of the ray direction.
+            max_distance (float): Maximum distance along the ray.
+            layer_mask (Optional[List[str]]): Only hit GameObjects on these layers. None means all layers.
+
+        Returns:
+            tuple[GameObject, float] | None: The hit GameObject and the distance to it, or None.
+        """
+        self.refresh()
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return None
+        dx, dy = dx / length, dy / length
+
+        boxes = self._boxes
+        best = None
+        best_distance = max_distance
+        tested = set()
+
+        def test(candidates):
+            nonlocal best, best_distance
+            for game_object in candidates:
+                if game_object in tested:
+                    continue
+                tested.add(game_object)
+                if not self._accepts(game_object, layer_mask):
+                    continue
+                distance = self._ray_box(boxes[game_object], x, y, dx, dy)
+                if distance is not None and distance <= best_distance:
+                    best, best_distance = game_object, distance
+
+        test(self._large)
+
+        bounds = self._cell_bounds
+        if bounds is not None:
+            # Amanatides-Woo traversal of the cells along the ray
+            size = self.cell_size
+            cx, cy = math.floor(x / size), math.floor(y / size)
+            step_x = (dx > 0) - (dx < 0)
+            step_y = (dy > 0) - (dy < 0)
+            t_max_x = ((cx + (dx > 0)) * size - x) / dx if dx != 0 else math.inf
+            t_max_y = ((cy + (dy > 0)) * size - y) / dy if dy != 0 else math.inf
+            t_delta_x = size / abs(dx) if dx != 0 else math.inf
+            t_delta_y = size / abs(dy) if dy != 0 else math.inf
+            cells = self.cells
+            t = 0.0
+            while t <= best_distance:
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    test(bucket)
+                if (step_x >= 0 and cx > bounds[2]) or (step_x <= 0 and cx < bounds[0]) or \
+                   (step_y >= 0 and cy > bounds[3]) or (step_y <= 0 and cy < bounds[1]):
+                    break  # Outside the occupied part of the grid and not heading towards it
+                if t_max_x < t_max_y:
+                    t, cx = t_max_x, cx + step_x
+                    t_max_x += t_delta_x
+                else:
+                    t, cy = t_max_y, cy + step_y
+                    t_max_y += t_delta_y
+
+        return (best, best_distance) if best is not None else None
+
+    # ---------------- Geometry helpers ----------------
+    @staticmethod
+    def _distance_sq(box, x: float, y: float) -> float:
+        left, top, right, bottom = box
+        nx = left if x < left else right if x > right else x
+        ny = top if y < top else bottom if y > bottom else y
+        return (x - nx) ** 2 + (y - ny) ** 2
+
+    @staticmethod
+    def _ray_box(box, x: float, y: float, dx: float, dy: float) -> float | None:
+        """Slab test; return the distance along a normalised ray to the box, or None if it misses."""
+        left, top, right, bottom = box
+        t_near, t_far = 0.0, math.inf
+        for origin, direction, low, high in ((x, dx, left, right), (y, dy, top, bottom)):
+            if direction == 0:
+                if origin < low or origin > high:
+                    return None
+                continue
+            t1, t2 = (low - origin) / direction, (high - origin) / direction
+            if t1 > t2:
+                t1, t2 = t2, t1
+            if t1 > t_near:
+                t_near = t1
+            if t2 < t_far:
+                t_far = t2
+            if t_near > t_far:
+                return None
+        return t_near
+
+    @staticmethod
+    def _ring_cells(qx: int, qy: int, ring: int):
+        """Yield the cells at Chebyshev distance `ring` from (qx, qy)."""
+        if ring == 0:
+            yield qx, qy
+            return
+        for cx in range(qx - ring, qx + ring + 1):
+            yield cx, qy - ring
+            yield cx, qy + ring
+        for cy in range(qy - ring + 1, qy + ring):
+            yield qx - ring, cy
+            yield qx + ring, cy
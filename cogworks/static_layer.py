@@ -0,0 +1,190 @@
+import bisect
+import math
+from collections import OrderedDict
+
+import pygame
+
+from cogworks.utils.asset_loader import has_alpha_channel
+
+
+class StaticLayer:
+    """
+    Render layer that pre-composites the components of static GameObjects into chunk surfaces.
+
+    The world is cut into square chunks of chunk_size screen pixels at the camera zoom. A chunk
+    is baked the first time it is on screen, by drawing every member overlapping it in draw
+    order, and is then drawn with a single blit each frame until one of those members changes.
+    Changing the zoom re-bakes the layer; while the zoom keeps changing, members are drawn
+    directly instead.
+
+    Chunks are composited with premultiplied alpha, so the baked result matches drawing the
+    members one by one. At most max_chunks are kept, least recently drawn dropped first.
+    """
+
+    def __init__(self, components: list, chunk_size: int = 512, max_chunks: int = 64):
+        """
+        Initialise a layer. Nothing is baked until it is first drawn.
+
+        Args:
+            components (list): Bakeable components (see Component.bakeable), in draw order.
+            chunk_size (int): Width and height of a chunk in screen pixels.
+            max_chunks (int): Number of baked chunks kept before the least recently drawn are dropped.
+        """
+        self.components = components
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self._index = {comp: i for i, comp in enumerate(components)}
+
+        self._zoom: float | None = None       # Zoom the layout below was built for
+        self._last_zoom: float | None = None  # Zoom of the previous frame
+        self._blits: list[list] = []          # Per component: its (image, (x, y), alpha) blits at _zoom
+        self._keys: list[list] = []           # Per component: the chunks its blits overlap
+        self._members: dict[tuple[int, int], list[int]] = {}  # Chunk -> components overlapping it, in draw order
+        self._chunks: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()  # least recently drawn first
+        self._premultiplied: dict[tuple, pygame.Surface] = {}
+        self._dirty: set[int] = set()
+        self.bakes = 0  # Number of chunks baked since the layer was created
+
+    def invalidate(self, component=None) -> None:
+        """
+        Re-bake the chunks a member covers, before and after its change, when next drawn.
+
+        Args:
+            component: The member that changed. None re-bakes the whole layer.
+        """
+        if component is None:
+            self._zoom = None
+            return
+        index = self._index.get(component)
+        if index is not None and self._zoom is not None:
+            self._dirty.add(index)
+
+    def render(self, queue, surface: pygame.Surface, left: float, top: float, zoom: float) -> None:
+        """
+        Submit the chunks in view to a RenderQueue.
+
+        Args:
+            queue (RenderQueue): Active queue to submit the chunk blits to.
+            surface (pygame.Surface): Surface being rendered to.
+            left (float): Left edge of the view in world coordinates.
+            top (float): Top edge of the view in world coordinates.
+            zoom (float): Camera zoom.
+        """
+        if zoom != self._zoom:
+            settled = zoom == self._last_zoom
+            self._last_zoom = zoom
+            if not settled:
+                for comp in self.components:  # Zooming: baking now would be thrown away next frame
+                    if _in_active_hierarchy(comp.game_object):
+                        comp.render(surface)
+                return
+            self._layout(zoom)
+        self._last_zoom = zoom
+        if self._dirty:
+            self._update_dirty()
+
+        size = self.chunk_size
+        view_left, view_top = left * zoom, top * zoom
+        width, height = surface.get_size()
+        members, chunks = self._members, self._chunks
+        for chunk_y in range(math.floor(view_top / size), math.floor((view_top + height) / size) + 1):
+            for chunk_x in range(math.floor(view_left / size), math.floor((view_left + width) / size) + 1):
+                key = (chunk_x, chunk_y)
+                if key not in members:
+                    continue
+                chunk = chunks.get(key)
+                if chunk is None:
+                    chunk = self._bake(key)
+                else:
+                    chunks.move_to_end(key)
+                dest = (math.floor(chunk_x * size - view_left), math.floor(chunk_y * size - view_top))
+                queue.submit(chunk, dest, None, pygame.BLEND_PREMULTIPLIED)
+        self._premultiplied.clear()  # Only shared between the chunks baked in one frame, to bound memory
+
+    def _layout(self, zoom: float):
+        """Work out every member's blits and the chunks they overlap at a zoom. Drops all baked chunks."""
+        self._zoom = zoom
+        self._chunks.clear()
+        self._members.clear()
+        self._dirty.clear()
+        self._blits = [[] for _ in self.components]
+        self._keys = [[] for _ in self.components]
+        for index in range(len(self.components)):
+            self._place(index)
+
+    def _place(self, index: int):
+        comp = self.components[index]
+        blits = comp.get_static_blits(self._zoom) if _in_active_hierarchy(comp.game_object) else []
+        size = self.chunk_size
+        keys = set()
+        for image, (x, y), _ in blits:
+            width, height = image.get_size()
+            for chunk_y in range(math.floor(y / size), math.floor((y + height) / size) + 1):
+                for chunk_x in range(math.floor(x / size), math.floor((x + width) / size) + 1):
+                    keys.add((chunk_x, chunk_y))
+        self._blits[index] = blits
+        self._keys[index] = list(keys)
+        for key in keys:
+            bisect.insort(self._members.setdefault(key, []), index)
+
+    def _update_dirty(self):
+        for index in self._dirty:
+            for key in self._keys[index]:
+                self._members[key].remove(index)
+                if not self._members[key]:
+                    del self._members[key]
+                self._chunks.pop(key, None)
+            self._place(index)
+            for key in self._keys[index]:
+                self._chunks.pop(key, None)
+        self._dirty.clear()
+
+    def _bake(self, key: tuple[int, int]) -> pygame.Surface:
+        size = self.chunk_size
+        origin_x, origin_y = key[0] * size, key[1] * size
+        chunk = pygame.Surface((size, size), pygame.SRCALPHA, 32)
+        commands = []
+        for index in self._members[key]:
+            for image, (x, y), alpha in self._blits[index]:
+                dest = (math.floor(x) - origin_x, math.floor(y) - origin_y)  # Floored, so sprites split across chunks line up
+                commands.append((self._premultiply(image, alpha), dest, None, pygame.BLEND_PREMULTIPLIED))
+        chunk.blits(commands, doreturn=False)
+
+        self._chunks[key] = chunk
+        self.bakes += 1
+        while len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+        return chunk
+
+    def _premultiply(self, image: pygame.Surface, alpha: int) -> pygame.Surface:
+        """Return a per-pixel alpha copy of an image with alpha applied and premultiplied, shared within the layer."""
+        key = (image, alpha)
+        premultiplied = self._premultiplied.get(key)
+        if premultiplied is None:
+            premultiplied = self._premultiplied[key] = premultiply(image, alpha)
+        return premultiplied
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+
+def premultiply(image: pygame.Surface, alpha: int = 255) -> pygame.Surface:
+    """
+    Return a per-pixel alpha copy of an image with an extra alpha applied and the colours premultiplied
+    by alpha, for compositing onto transparent surfaces that are later drawn with BLEND_PREMULTIPLIED.
+    Plain alpha blits onto a transparent surface would darken semi-transparent pixels.
+    """
+    premultiplied = image.copy() if has_alpha_channel(image) else image.convert_alpha()
+    if alpha < 255:
+        premultiplied.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+    premultiplied.set_alpha(None)
+    return premultiplied.premul_alpha()
+
+
+def _in_active_hierarchy(game_object) -> bool:
+    """Return True if a GameObject and all its ancestors are active."""
+    while game_object is not None:
+        if not game_object._active:
+            return False
+        game_object = game_object.parent
+    return True
@@ -0,0 +1,39 @@
+class TransformHierarchy:
+    """
+    Batches world transform updates for a Scene.
+
+    Transforms register themselves when they become dirty. Once per frame the scene calls
+    update(), which recomputes every pending world transform, so objects read cached values
+    afterwards instead of recomputing them lazily mid-phase. A transform brings its dirty
+    ancestors up to date first, so each world transform is computed once per change.
+
+    Transforms bound to a TransformStore are not registered here: the store updates them
+    in bulk from its arrays (see TransformStore.update_world).
+    """
+
+    def __init__(self):
+        """Initialise the transform hierarchy."""
+        self.pending = []
+
+    def register(self, transform):
+        """
+        Queue a transform whose world transform has just been invalidated.
+
+        Args:
+            transform (Transform): The dirty transform.
+        """
+        self.pending.append(transform)
+
+    def update(self):
+        """Recompute the world transforms of all pending dirty transforms."""
+        if not self.pending:
+            return
+
+        pending, self.pending = self.pending, []
+        for transform in pending:
+            if transform._dirty:
+                transform._update_world()
+
+    def clear(self):
+        """Drop all pending transforms."""
+        self.pending.clear()
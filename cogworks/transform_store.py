@@ -0,0 +1,319 @@
+import math
+from array import array
+from operator import attrgetter
+
+from cogworks.components.transform import Transform
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, but required to use a TransformStore
+    np = None
+
+
+LOCAL_FIELDS = ("local_x", "local_y", "local_rotation", "local_scale_x", "local_scale_y")
+WORLD_FIELDS = (
+    "world_x", "world_y", "world_a", "world_b", "world_c", "world_d",
+    "world_rotation", "world_scale_x", "world_scale_y",
+)
+
+
+class TransformStore:
+    """
+    Structure-of-arrays storage for Transforms.
+
+    Each bound Transform gets an integer handle, and its local and cached world values live
+    in contiguous float arrays at that index (store.world_x and so on). Bound transforms keep
+    the normal Transform API and simply read and write the arrays.
+
+    World transforms of all dirty handles are recomputed by update_world() in one NumPy
+    pass per hierarchy depth, without touching the Transform objects. Code reading whole
+    arrays at once (snapshots, interpolation) should copy them, e.g. np.array(store.world_x):
+    the arrays grow as transforms are bound, which fails while a buffer view of them is held.
+
+    A store only holds complete hierarchies: a transform is bound only when its parent is
+    bound to the same store (or it has no parent).
+    """
+
+    def __init__(self):
+        if np is None:
+            raise ImportError("TransformStore requires NumPy (pip install cogworks[numpy])")
+
+        for name in LOCAL_FIELDS + WORLD_FIELDS:
+            setattr(self, name, array("d"))
+        self.dirty = array("b")
+        self.alive = array("b")
+        self.parent = array("i")  # Parent handle, -1 for roots
+        self.depth = array("i")
+
+        self.transforms: list[Transform | None] = []  # handle -> Transform
+        self._float_arrays = [getattr(self, name) for name in LOCAL_FIELDS + WORLD_FIELDS]
+        self._free: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.transforms) - len(self._free)
+
+    # ---------------- Binding ----------------
+    def bind(self, transform: Transform) -> bool:
+        """
+        Move a transform's values into the store.
+
+        Args:
+            transform (Transform): The transform to bind.
+
+        Returns:
+            bool: True if the transform is now stored here. Subclasses of Transform and
+            transforms whose parent lives outside this store stay unbound.
+        """
+        if transform._store is self:
+            return True
+        if type(transform) is not Transform:
+            return False
+
+        game_object = transform.game_object
+        parent = game_object.parent if game_object is not None else None
+        if parent is not None and parent.transform._store is not self:
+            return False
+
+        handle = self._free.pop() if self._free else self._grow()
+        values = (
+            transform._local_x, transform._local_y, transform._local_rotation,
+            transform._local_scale_x, transform._local_scale_y,
+        ) + tuple(transform._world)
+        for values_array, value in zip(self._float_arrays, values):
+            values_array[handle] = value
+        self.dirty[handle] = transform._dirty
+        self.alive[handle] = 1
+        if parent is not None:
+            parent_handle = parent.transform._handle
+            self.parent[handle] = parent_handle
+            self.depth[handle] = self.depth[parent_handle] + 1
+        else:
+            self.parent[handle] = -1
+            self.depth[handle] = 0
+
+        self.transforms[handle] = transform
+        transform._store = self
+        transform._handle = handle
+        transform.__class__ = StoredTransform
+        return True
+
+    def release(self, transform: Transform) -> None:
+        """
+        Copy a transform's values back into the object and free its handle.
+
+        Args:
+            transform (Transform): The transform to release.
+        """
+        if transform._store is not self:
+            return
+
+        handle = transform._handle
+        local = [getattr(self, name)[handle] for name in LOCAL_FIELDS]
+        world = tuple(getattr(self, name)[handle] for name in WORLD_FIELDS)
+        dirty = bool(self.dirty[handle])
+
+        transform.__class__ = Transform
+        (transform._local_x, transform._local_y, transform._local_rotation,
+         transform._local_scale_x, transform._local_scale_y) = local
+        transform._world = world
+        transform._dirty = dirty
+        transform._store = None
+        transform._handle = -1
+
+        self.transforms[handle] = None
+        self.dirty[handle] = 0
+        self.alive[handle] = 0
+        self.parent[handle] = -1
+        self._free.append(handle)
+
+    def bind_hierarchy(self, game_object) -> None:
+        """Bind a GameObject's transform and all its descendants' transforms."""
+        if self.bind(game_object.transform):
+            for child in game_object.children:
+                self.bind_hierarchy(child)
+
+    def release_hierarchy(self, game_object) -> None:
+        """Release a GameObject's transform and all its descendants' transforms."""
+        self.release(game_object.transform)
+        for child in game_object.children:
+            self.release_hierarchy(child)
+
+    def reparent(self, transform: Transform) -> None:
+        """Refresh the stored parent handle and depth of a transform whose parent changed within this store."""
+        parent = transform.game_object.parent
+        handle = transform._handle
+        if parent is None:
+            self.parent[handle] = -1
+            self.depth[handle] = 0
+        else:
+            parent_handle = parent.transform._handle
+            self.parent[handle] = parent_handle
+            self.depth[handle] = self.depth[parent_handle] + 1
+        for child in transform.game_object.children:
+            if child.transform._store is self:
+                self.reparent(child.transform)
+
+    def _grow(self) -> int:
+        handle = len(self.transforms)
+        for values_array in self._float_arrays:
+            values_array.append(0.0)
+        self.dirty.append(0)
+        self.alive.append(0)
+        self.parent.append(-1)
+        self.depth.append(0)
+        self.transforms.append(None)
+        return handle
+
+    # ---------------- Bulk access ----------------
+    def _view(self, name: str) -> "np.ndarray":
+        """
+        Return a writable NumPy view over one of the store's arrays (e.g. "world_x").
+        Only hold it for the duration of a call: an array.array with a buffer view cannot
+        grow, so binding a transform while one is alive raises BufferError.
+
+        Args:
+            name (str): A field name from LOCAL_FIELDS, WORLD_FIELDS, "dirty", "alive", "parent" or "depth".
+        """
+        values = getattr(self, name)
+        if values.typecode == "d":
+            return np.frombuffer(values, dtype=np.float64)
+        if values.typecode == "b":
+            return np.frombuffer(values, dtype=np.int8)
+        return np.frombuffer(values, dtype=np.intc)
+
+    def mark_dirty(self, handles) -> None:
+        """
+        Invalidate the world transforms of the given handles (and their descendants)
+        after their local_* array values were written directly.
+
+        Args:
+            handles (Iterable[int]): Handles whose local values changed.
+        """
+        transforms = self.transforms
+        for handle in handles:
+            transform = transforms[handle]
+            if transform is not None:
+                transform._dirty = False
+                transform._mark_dirty()
+
+    def update_world(self) -> None:
+        """
+        Recompute the world transform of every dirty handle, one vectorised pass per depth.
+        World rotation and scale are composed as in Transform, with the same limitation under
+        non-uniform parent scale.
+        """
+        if not self.transforms:
+            return
+
+        dirty = self._view("dirty")
+        dirty_handles = np.flatnonzero(dirty)
+        if dirty_handles.size == 0:
+            return
+
+        local_x, local_y = self._view("local_x"), self._view("local_y")
+        local_rotation = self._view("local_rotation")
+        local_sx, local_sy = self._view("local_scale_x"), self._view("local_scale_y")
+        world_x, world_y = self._view("world_x"), self._view("world_y")
+        world_a, world_b = self._view("world_a"), self._view("world_b")
+        world_c, world_d = self._view("world_c"), self._view("world_d")
+        world_rotation = self._view("world_rotation")
+        world_sx, world_sy = self._view("world_scale_x"), self._view("world_scale_y")
+        parents = self._view("parent")
+
+        depths = self._view("depth")[dirty_handles]
+        for depth in np.unique(depths):
+            idx = dirty_handles[depths == depth]
+            sx, sy = local_sx[idx], local_sy[idx]
+            rot = local_rotation[idx]
+            radians = rot * (math.pi / 180.0)
+            cos, sin = np.cos(radians), np.sin(radians)
+            la, lb, lc, ld = sx * cos, -sx * sin, sy * sin, sy * cos
+            lx, ly = local_x[idx], local_y[idx]
+
+            if depth == 0:
+                world_x[idx], world_y[idx] = lx, ly
+                world_a[idx], world_b[idx], world_c[idx], world_d[idx] = la, lb, lc, ld
+                world_rotation[idx] = rot
+                world_sx[idx], world_sy[idx] = sx, sy
+                continue
+
+            p = parents[idx]
+            pa, pb, pc, pd = world_a[p], world_b[p], world_c[p], world_d[p]
+            world_x[idx] = pa * lx + pc * ly + world_x[p]
+            world_y[idx] = pb * lx + pd * ly + world_y[p]
+            world_a[idx] = pa * la + pc * lb
+            world_b[idx] = pb * la + pd * lb
+            world_c[idx] = pa * lc + pc * ld
+            world_d[idx] = pb * lc + pd * ld
+            world_rotation[idx] = world_rotation[p] + rot
+            world_sx[idx] = world_sx[p] * sx
+            world_sy[idx] = world_sy[p] * sy
+
+        dirty[dirty_handles] = 0
+
+    def clear(self) -> None:
+        """Release every bound transform."""
+        for transform in list(self.transforms):
+            if transform is not None:
+                self.release(transform)
+
+
+def _stored_field(name: str) -> property:
+    """Build a property that reads and writes one TransformStore array at the transform's handle."""
+    get_array = attrgetter(name)
+
+    def fget(self):
+        return get_array(self._store)[self._handle]
+
+    def fset(self, value):
+        get_array(self._store)[self._handle] = value
+
+    return property(fget, fset)
+
+
+class StoredTransform(Transform):
+    """
+    A Transform whose values live in a TransformStore.
+
+    Bound transforms are switched to this class by TransformStore.bind and back to
+    Transform on release; it shares Transform's slot layout and only redirects the
+    private local/world/dirty fields to the store's arrays.
+    """
+
+    __slots__ = ()
+
+    _local_x = _stored_field("local_x")
+    _local_y = _stored_field("local_y")
+    _local_rotation = _stored_field("local_rotation")
+    _local_scale_x = _stored_field("local_scale_x")
+    _local_scale_y = _stored_field("local_scale_y")
+
+    @property
+    def _world(self) -> tuple:
+        store, handle = self._store, self._handle
+        return (
+            store.world_x[handle], store.world_y[handle],
+            store.world_a[handle], store.world_b[handle], store.world_c[handle], store.world_d[handle],
+            store.world_rotation[handle], store.world_scale_x[handle], store.world_scale_y[handle],
+        )
+
+    @_world.setter
+    def _world(self, world: tuple):
+        store, handle = self._store, self._handle
+        (store.world_x[handle], store.world_y[handle],
+         store.world_a[handle], store.world_b[handle], store.world_c[handle], store.world_d[handle],
+         store.world_rotation[handle], store.world_scale_x[handle], store.world_scale_y[handle]) = world
+
+    @property
+    def _dirty(self) -> bool:
+        return self._store.dirty[self._handle] != 0
+
+    @_dirty.setter
+    def _dirty(self, value: bool):
+        self._store.dirty[self._handle] = 1 if value else 0
+
+    def get_world_position(self) -> tuple[float, float]:
+        store, handle = self._store, self._handle
+        if store.dirty[handle]:
+            self._update_world()
+        return store.world_x[handle], store.world_y[handle]
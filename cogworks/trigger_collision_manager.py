@@ -22,6 +22,15 @@ class TriggerCollisionManager:
         """
         self.colliders.add(collider)
 
+    def register_many(self, colliders):
+        """
+        Register several colliders to the collision manager at once.
+
+        Args:
+            colliders (Iterable[TriggerCollider]): The colliders to be tracked.
+        """
+        self.colliders.update(colliders)
+
     def unregister(self, collider):
         """
         Unregister a collider from the collision manager.
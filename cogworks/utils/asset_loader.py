@@ -1,7 +1,260 @@
 import os
+from collections import OrderedDict
+
 import pygame
 import importlib.resources as res
 
+
+# Colour keys tried, in order, when turning an image with on/off alpha into a colour-keyed one
+_COLORKEY_CANDIDATES = ((255, 0, 255), (0, 255, 255), (255, 255, 0), (1, 2, 3))
+
+
+class _ImageCacheEntry:
+    __slots__ = ("surface", "refs", "size", "retired")
+
+    def __init__(self, surface: pygame.Surface):
+        self.surface = surface
+        self.refs = 0
+        self.size = surface.get_pitch() * surface.get_height()  # bytes of pixel data
+        self.retired: list[pygame.Surface] = []  # Surfaces replaced by reconvert() that may still be referenced
+
+
+class ImageCache:
+    """
+    Process-wide cache of decoded and converted images, keyed by file path and conversion mode
+    ("rle" or "plain", see convert_image).
+
+    Every load of a cached image returns the same Surface, so loaded images are shared and
+    must not be modified in place (copy them first). Each load takes a reference, which
+    should be handed back with release() once the image is no longer used. Unreferenced
+    images stay cached, and the least recently used ones are evicted once the cache holds
+    more than budget_bytes of pixel data. Referenced images are never evicted.
+    """
+
+    def __init__(self, budget_bytes: int = 128 * 1024 * 1024):
+        """
+        Initialise an empty image cache.
+
+        Args:
+            budget_bytes (int): Pixel data the cache may hold before unreferenced images are evicted.
+        """
+        self.budget_bytes = budget_bytes
+        self._entries: OrderedDict[tuple, _ImageCacheEntry] = OrderedDict()  # least recently used first
+        self._keys: dict[int, tuple] = {}  # id(surface) -> key
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple, loader) -> pygame.Surface:
+        """
+        Return the cached image for a key, loading it on a miss, and take a reference to it.
+
+        Args:
+            key (tuple): Cache key, e.g. (absolute path, conversion mode).
+            loader (Callable[[], pygame.Surface]): Loads the image if it is not cached.
+
+        Returns:
+            pygame.Surface: The shared image.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        else:
+            self.misses += 1
+            entry = _ImageCacheEntry(loader())
+            self._entries[key] = entry
+            self._keys[id(entry.surface)] = key
+            self.bytes += entry.size
+        entry.refs += 1
+        if self.bytes > self.budget_bytes:
+            self._evict()
+        return entry.surface
+
+    def retain(self, surface: pygame.Surface) -> None:
+        """Take another reference to a cached image, e.g. when a component holding it is cloned."""
+        key = self._keys.get(id(surface))
+        if key is not None:
+            self._entries[key].refs += 1
+
+    def release(self, surface: pygame.Surface) -> None:
+        """Hand back a reference taken by a load. Images that were never cached are ignored."""
+        key = self._keys.get(id(surface))
+        if key is None:
+            return
+        entry = self._entries[key]
+        if entry.refs > 0:
+            entry.refs -= 1
+        if entry.refs == 0:
+            self._drop_retired(entry)
+            if self.bytes > self.budget_bytes:
+                self._evict()
+
+    def set_budget(self, budget_bytes: int) -> None:
+        """Change the byte budget, evicting unreferenced images that no longer fit."""
+        self.budget_bytes = budget_bytes
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used unreferenced images until the cache fits its budget."""
+        for key in [key for key, entry in self._entries.items() if entry.refs == 0]:
+            if self.bytes <= self.budget_bytes:
+                break
+            self._remove(key)
+            self.evictions += 1
+
+    def _remove(self, key: tuple):
+        entry = self._entries.pop(key)
+        del self._keys[id(entry.surface)]
+        self._drop_retired(entry)
+        self.bytes -= entry.size
+
+    def _drop_retired(self, entry: _ImageCacheEntry):
+        for surface in entry.retired:
+            del self._keys[id(surface)]
+        entry.retired.clear()
+
+    def reconvert(self) -> int:
+        """
+        Convert cached images again for the current display, after the display mode changed.
+        Images whose pixel format still matches the display are left alone.
+
+        Later loads get the new surfaces. Surfaces handed out before stay valid, and releasing
+        them still counts against their image.
+
+        Returns:
+            int: Number of images converted.
+        """
+        if not pygame.display.get_init() or pygame.display.get_surface() is None:
+            return 0
+        formats = {
+            False: _pixel_format(pygame.Surface((1, 1)).convert()),
+            True: _pixel_format(pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()),
+        }
+        converted = 0
+        for key, entry in self._entries.items():
+            surface = entry.surface
+            if _pixel_format(surface) == formats[has_alpha_channel(surface)]:
+                continue
+            new_surface = convert_image(surface, rle=key[-1] == "rle")
+            if entry.refs > 0:
+                entry.retired.append(surface)  # Still in use; its id stays mapped so release() finds the entry
+            else:
+                del self._keys[id(surface)]
+            entry.surface = new_surface
+            self._keys[id(new_surface)] = key
+            new_size = new_surface.get_pitch() * new_surface.get_height()
+            self.bytes += new_size - entry.size
+            entry.size = new_size
+            converted += 1
+        return converted
+
+    def clear(self) -> None:
+        """Forget every cached image. Surfaces already handed out stay valid."""
+        self._entries.clear()
+        self._keys.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        """Return hit, miss and eviction counts, cached entries and bytes, and the budget."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "budget_bytes": self.budget_bytes,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by load_engine_image and load_user_image
+image_cache = ImageCache()
+
+
+def _pixel_format(surface: pygame.Surface) -> tuple:
+    return surface.get_bitsize(), surface.get_masks()
+
+
+def has_alpha_channel(surface: pygame.Surface) -> bool:
+    """
+    Return True if a surface has per-pixel alpha. Unlike the SRCALPHA flag, this is not
+    set by giving a surface a whole-surface alpha with set_alpha.
+    """
+    return surface.get_masks()[3] != 0
+
+
+def convert_image(image: pygame.Surface, rle: bool = True) -> pygame.Surface:
+    """
+    Convert a decoded image to the display pixel format that blits fastest for the transparency it uses:
+
+    - no transparency: convert(), blitted as a straight copy;
+    - a colour key, or alpha that is only ever fully transparent or fully opaque: convert() with a
+      colour key, RLE-accelerated so transparent runs are skipped;
+    - partial transparency: convert_alpha(), blended per pixel.
+
+    Args:
+        image (pygame.Surface): The decoded image. It is not modified.
+        rle (bool): Allow RLE acceleration. Pass False for images that are cut into subsurfaces
+            (sprite sheets, atlases), since SDL decodes an RLE surface whenever a subsurface of it is blitted.
+
+    Returns:
+        pygame.Surface: A new surface in the display format.
+    """
+    _ensure_pygame_display()
+    flags = pygame.RLEACCEL if rle else 0
+
+    if not has_alpha_channel(image):
+        colorkey = image.get_colorkey()
+        converted = image.convert()
+        if colorkey is not None:
+            converted.set_colorkey(colorkey, flags)
+        return converted
+
+    width, height = image.get_size()
+    opaque = pygame.mask.from_surface(image, 254)  # Pixels with alpha 255
+    opaque_count = opaque.count()
+    if opaque_count == width * height:
+        return image.convert()
+    if opaque_count != pygame.mask.from_surface(image, 0).count():
+        return image.convert_alpha()  # Some pixels are partly transparent
+
+    # On/off alpha: fill the transparent pixels with a colour no opaque pixel has, and key it out
+    converted = image.convert()
+    for colorkey in _COLORKEY_CANDIDATES:
+        if not pygame.mask.from_threshold(converted, colorkey, (1, 1, 1, 255)).overlap_area(opaque, (0, 0)):
+            break
+    else:
+        return image.convert_alpha()
+    transparent = opaque.copy()
+    transparent.invert()
+    transparent.to_surface(converted, setcolor=colorkey, unsetcolor=None)
+    converted.set_colorkey(colorkey, flags)
+    return converted
+
+
+def apply_alpha(surface: pygame.Surface, alpha: int) -> None:
+    """
+    Set the whole-surface alpha of an image before blitting it, without slowing down later blits.
+
+    On surfaces without per-pixel alpha, an alpha of 255 is stored as no surface alpha at all, since
+    SDL would otherwise still blend every pixel. The surface is only touched when the value changes,
+    and colour-keyed surfaces keep their RLE acceleration.
+
+    Args:
+        surface (pygame.Surface): The image.
+        alpha (int): 0 (invisible) to 255 (opaque).
+    """
+    per_pixel = has_alpha_channel(surface)
+    value = None if alpha == 255 and not per_pixel else alpha
+    if surface.get_alpha() != value:
+        rle = not per_pixel and surface.get_colorkey() is not None and surface.get_parent() is None
+        surface.set_alpha(value, pygame.RLEACCEL if rle else 0)
+
+
 def load_engine_audio(relative_path: str) -> pygame.mixer.Sound:
     """
     Load an audio file bundled inside the cogworks package.
@@ -45,32 +298,43 @@ def _ensure_pygame_mixer():
     if not pygame.mixer.get_init():
         pygame.mixer.init()
 
-def load_engine_image(relative_path: str) -> pygame.Surface:
+def load_engine_image(relative_path: str, rle: bool = True) -> pygame.Surface:
     """
-    Load an image bundled inside the cogworks package.
+    Load an image bundled inside the cogworks package, through the shared image cache,
+    converted to the fastest display format for it (see convert_image).
+    The returned Surface is shared and must not be modified in place.
     Example: load_engine_image("images/default.png")
     """
-    with res.files("cogworks.engine_assets").joinpath(relative_path).open("rb") as f:
-        img = pygame.image.load(f).convert_alpha()
-    _ensure_pygame_display()
-    return img
+    resource = res.files("cogworks.engine_assets").joinpath(relative_path)
+
+    def load():
+        with resource.open("rb") as f:
+            return convert_image(pygame.image.load(f), rle)
+
+    return image_cache.get((str(resource), "rle" if rle else "plain"), load)
 
 
-def load_user_image(relative_path: str) -> pygame.Surface:
+def load_user_image(relative_path: str, rle: bool = True) -> pygame.Surface:
     """
-    Load an image from the user's project 'assets' folder.
+    Load an image from the user's project 'assets' folder, through the shared image cache,
+    converted to the fastest display format for it (see convert_image).
+    The returned Surface is shared and must not be modified in place.
     Example: load_user_image("images/player.png")
+
+    Args:
+        relative_path (str): Path inside the 'assets' folder.
+        rle (bool): Allow RLE acceleration. Pass False for images that will be cut into subsurfaces.
     """
     project_root = os.getcwd()
     assets_dir = os.path.join(project_root, "assets")
     abs_path = os.path.join(assets_dir, relative_path)
 
-    if not os.path.exists(abs_path):
-        raise FileNotFoundError(f"User asset not found: {abs_path}")
+    def load():
+        if not os.path.exists(abs_path):
+            raise FileNotFoundError(f"User asset not found: {abs_path}")
+        return convert_image(pygame.image.load(abs_path), rle)
 
-    img = pygame.image.load(abs_path).convert_alpha()
-    _ensure_pygame_display()
-    return img
+    return image_cache.get((abs_path, "rle" if rle else "plain"), load)
 
 def load_user_font(relative_path: str, font_size: int) -> pygame.font.Font:
     """
@@ -0,0 +1,105 @@
+"""
+Offline texture atlas packer.
+
+Combines every image in a directory into as few atlas pages as fit within a maximum size,
+and writes the pages plus a JSON file describing where each image ended up. Load the result
+with SpriteSheet.from_atlas.
+
+Usage:
+    python -m cogworks.utils.atlas_packer assets/images assets/atlases/images --max-size 2048 --padding 1
+
+This writes assets/atlases/images.json and assets/atlases/images_0.png, images_1.png, ...
+"""
+import argparse
+import json
+import os
+
+import pygame
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tga", ".webp")
+
+
+def pack_atlas(source_dir: str, output_path: str, max_size: int = 2048, padding: int = 1) -> dict:
+    """
+    Pack the images of a directory (including subdirectories) into atlas pages.
+
+    Images are placed tallest first on horizontal shelves; a new page is started when the
+    current one is full. Each page is cropped to the area actually used.
+
+    Args:
+        source_dir (str): Directory containing the images to pack.
+        output_path (str): Output path without extension; "<output_path>.json" and
+            "<output_path>_<page>.png" are written.
+        max_size (int): Maximum width and height of a page in pixels.
+        padding (int): Transparent pixels left between images, to avoid bleeding when scaled.
+
+    Returns:
+        dict: The atlas metadata that was written: {"pages": [file names], "frames": {name: region}}.
+    """
+    images = []
+    for root, _, files in os.walk(source_dir):
+        for file_name in sorted(files):
+            if file_name.lower().endswith(IMAGE_EXTENSIONS):
+                path = os.path.join(root, file_name)
+                name = os.path.relpath(path, source_dir).replace(os.sep, "/")
+                image = pygame.image.load(path)
+                if image.get_width() > max_size or image.get_height() > max_size:
+                    raise ValueError(f"{path} is larger than the maximum atlas size {max_size}")
+                images.append((name, image))
+    if not images:
+        raise ValueError(f"No images found in {source_dir}")
+
+    images.sort(key=lambda item: (-item[1].get_height(), -item[1].get_width(), item[0]))
+
+    # Shelf packing: each page is a list of (name, image, x, y) placements
+    pages = [[]]
+    page_sizes = [[0, 0]]
+    shelf_x = shelf_y = shelf_height = 0
+    for name, image in images:
+        width, height = image.get_size()
+        if shelf_x + width > max_size:  # Start a new shelf
+            shelf_x, shelf_y, shelf_height = 0, shelf_y + shelf_height + padding, 0
+        if shelf_y + height > max_size:  # Start a new page
+            pages.append([])
+            page_sizes.append([0, 0])
+            shelf_x = shelf_y = shelf_height = 0
+        pages[-1].append((name, image, shelf_x, shelf_y))
+        page_sizes[-1][0] = max(page_sizes[-1][0], shelf_x + width)
+        page_sizes[-1][1] = max(page_sizes[-1][1], shelf_y + height)
+        shelf_x += width + padding
+        shelf_height = max(shelf_height, height)
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    base_name = os.path.basename(output_path)
+
+    metadata = {"pages": [], "frames": {}}
+    for page_index, (placements, size) in enumerate(zip(pages, page_sizes)):
+        page = pygame.Surface(size, pygame.SRCALPHA, 32)
+        for name, image, x, y in placements:
+            page.blit(image, (x, y))
+            metadata["frames"][name] = {"page": page_index, "x": x, "y": y, "w": image.get_width(), "h": image.get_height()}
+        page_file = f"{base_name}_{page_index}.png"
+        pygame.image.save(page, os.path.join(output_dir, page_file))
+        metadata["pages"].append(page_file)
+
+    with open(f"{output_path}.json", "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2, sort_keys=True)
+    return metadata
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Pack a directory of images into texture atlas pages plus JSON metadata.")
+    parser.add_argument("source_dir", help="Directory containing the images to pack")
+    parser.add_argument("output_path", help="Output path without extension, e.g. assets/atlases/images")
+    parser.add_argument("--max-size", type=int, default=2048, help="Maximum page width and height (default 2048)")
+    parser.add_argument("--padding", type=int, default=1, help="Pixels between packed images (default 1)")
+    args = parser.parse_args(argv)
+
+    metadata = pack_atlas(args.source_dir, args.output_path, args.max_size, args.padding)
+    print(f"Packed {len(metadata['frames'])} images into {len(metadata['pages'])} page(s): {args.output_path}.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+from collections import OrderedDict
+
+import pygame
+
+from cogworks.utils.asset_loader import has_alpha_channel
+
+
+def transform_image(
+    image: pygame.Surface,
+    angle: float,
+    scale_x: float,
+    scale_y: float,
+    pixel_art_mode: bool = False,
+    flip_x: bool = False,
+    flip_y: bool = False
+) -> pygame.Surface:
+    """
+    Return a new Surface with an image scaled, rotated counter-clockwise by angle degrees and flipped.
+    Pixel-art mode scales each axis without smoothing; otherwise rotozoom scales by the average scale.
+
+    An identity transform returns the image itself, keeping its (fast) display format. Images
+    without per-pixel alpha keep their format unless rotation corners or smoothed colour-key
+    edges need alpha, in which case they are transformed from an alpha copy.
+    """
+    if angle == 0 and scale_x == 1 and scale_y == 1 and not flip_x and not flip_y:
+        return image
+    if not has_alpha_channel(image) and (angle % 90 or (image.get_colorkey() is not None and not pixel_art_mode)):
+        image = image.convert_alpha()
+
+    if pixel_art_mode:
+        w, h = int(image.get_width() * scale_x), int(image.get_height() * scale_y)
+        transformed = pygame.transform.scale(image, (w, h))
+        if angle != 0:
+            transformed = pygame.transform.rotate(transformed, angle)
+    else:
+        avg_scale = (scale_x + scale_y) / 2 if scale_x != scale_y else scale_x
+        transformed = pygame.transform.rotozoom(image, angle, avg_scale)
+
+    if flip_x or flip_y:
+        transformed = pygame.transform.flip(transformed, flip_x, flip_y)
+    return transformed
+
+
+class RotationCache:
+    """
+    Process-wide cache of rotated (and scaled and flipped) images, shared by every Sprite
+    that uses the same source image.
+
+    Angles are snapped to one of `steps` evenly spaced angles, so a spinning sprite only ever
+    needs `steps` rotated images per scale, and after the first turn rotation is a dict lookup.
+    Scales can be snapped too (scale_step), which lets sprites with slightly different or
+    animated scales share images. Cached images are shared and must not be modified; the
+    least recently used ones are evicted once more than max_bytes of pixel data are cached.
+    """
+
+    def __init__(self, steps: int = 64, max_bytes: int = 32 * 1024 * 1024, scale_step: float = 0.0, enabled: bool = False):
+        """
+        Initialise an empty rotation cache.
+
+        Args:
+            steps (int): Number of angles per full turn (angular resolution 360 / steps degrees).
+            max_bytes (int): Pixel data the cache may hold before the least recently used images are evicted.
+            scale_step (float): Snap scales to multiples of this value. 0 keeps exact scales.
+            enabled (bool): Whether Sprites use the cache unless they choose otherwise (see Sprite's cache_rotations).
+        """
+        self.steps = steps
+        self.max_bytes = max_bytes
+        self.scale_step = scale_step
+        self.enabled = enabled
+        self._images: OrderedDict[tuple, pygame.Surface] = OrderedDict()  # least recently used first
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(
+        self,
+        steps: int | None = None,
+        max_bytes: int | None = None,
+        scale_step: float | None = None,
+        enabled: bool | None = None
+    ) -> None:
+        """Change the cache settings; arguments left as None keep their value. Cached images are dropped."""
+        if steps is not None:
+            self.steps = steps
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if scale_step is not None:
+            self.scale_step = scale_step
+        if enabled is not None:
+            self.enabled = enabled
+        self.clear()
+
+    def get(
+        self,
+        image: pygame.Surface,
+        angle: float,
+        scale_x: float = 1.0,
+        scale_y: float = 1.0,
+        pixel_art_mode: bool = False,
+        flip_x: bool = False,
+        flip_y: bool = False
+    ) -> pygame.Surface:
+        """
+        Return the image transformed as by transform_image, with the angle (and scale) snapped.
+
+        Returns:
+            pygame.Surface: The shared transformed image.
+        """
+        step = round(angle * self.steps / 360.0) % self.steps
+        if self.scale_step:
+            scale_x = round(scale_x / self.scale_step) * self.scale_step
+            scale_y = round(scale_y / self.scale_step) * self.scale_step
+        key = (image, step, scale_x, scale_y, pixel_art_mode, flip_x, flip_y)
+
+        transformed = self._images.get(key)
+        if transformed is not None:
+            self.hits += 1
+            self._images.move_to_end(key)
+            return transformed
+
+        self.misses += 1
+        transformed = transform_image(image, step * 360.0 / self.steps, scale_x, scale_y, pixel_art_mode, flip_x, flip_y)
+        self._images[key] = transformed
+        self.bytes += transformed.get_pitch() * transformed.get_height()
+        while self.bytes > self.max_bytes and len(self._images) > 1:
+            _, evicted = self._images.popitem(last=False)
+            self.bytes -= evicted.get_pitch() * evicted.get_height()
+            self.evictions += 1
+        return transformed
+
+    def warm(self, image: pygame.Surface, scale_x: float = 1.0, scale_y: float = 1.0, pixel_art_mode: bool = False) -> None:
+        """Pre-render every angle step of an image at one scale, e.g. while a level loads."""
+        for step in range(self.steps):
+            self.get(image, step * 360.0 / self.steps, scale_x, scale_y, pixel_art_mode)
+
+    def clear(self) -> None:
+        """Drop every cached image."""
+        self._images.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        """Return hit, miss and eviction counts, cached entries and bytes, and the byte cap."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._images),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+
+# Shared by every Sprite
+rotation_cache = RotationCache()
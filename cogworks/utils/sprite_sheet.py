@@ -0,0 +1,122 @@
+import json
+import os
+
+import pygame
+
+from cogworks.utils.asset_loader import load_user_image
+
+
+class SpriteSheet:
+    """
+    A set of sprite frames cut from one or more larger images.
+
+    Frames are subsurfaces: they share pixels with the sheet image instead of copying them,
+    so a sheet costs a single file open, decode and conversion, and every frame drawn from
+    it is blitted from the same source surface. Frames are addressed by index, and atlas
+    frames also by name.
+
+    Sheets come from a uniform grid (from_grid) or from the JSON metadata written by the
+    atlas packer (from_atlas, see cogworks.utils.atlas_packer).
+    """
+
+    def __init__(self, image_path: str, frames: list[pygame.Surface], names: dict[str, int] | None = None):
+        """
+        Initialise a sprite sheet from already cut frames. Use from_grid or from_atlas to load one.
+
+        Args:
+            image_path (str): Path of the sheet (image or atlas metadata) inside the 'assets' folder.
+            frames (list[pygame.Surface]): The frames, in index order.
+            names (dict[str, int] | None): Optional frame name -> index map.
+        """
+        self.image_path = image_path
+        self.frames = frames
+        self.names = names or {}
+
+    @classmethod
+    def from_grid(
+        cls,
+        image_path: str,
+        frame_width: int,
+        frame_height: int,
+        margin: int = 0,
+        spacing: int = 0,
+        count: int | None = None
+    ) -> "SpriteSheet":
+        """
+        Cut a sheet image into equally sized frames, left to right, then top to bottom.
+
+        Args:
+            image_path (str): Path to the sheet image (inside 'assets' folder).
+            frame_width (int): Width of each frame in pixels.
+            frame_height (int): Height of each frame in pixels.
+            margin (int): Pixels around the whole grid.
+            spacing (int): Pixels between neighbouring frames.
+            count (int | None): Number of frames to cut, if the last row is not full.
+
+        Returns:
+            SpriteSheet: The loaded sheet.
+        """
+        image = load_user_image(image_path, rle=False)  # Frames are subsurfaces
+        width, height = image.get_size()
+        columns = (width - 2 * margin + spacing) // (frame_width + spacing)
+        rows = (height - 2 * margin + spacing) // (frame_height + spacing)
+        if columns <= 0 or rows <= 0:
+            raise ValueError(f"Sprite sheet {image_path} is smaller than one {frame_width}x{frame_height} frame")
+
+        frames = []
+        for row in range(rows):
+            for column in range(columns):
+                if count is not None and len(frames) >= count:
+                    break
+                x = margin + column * (frame_width + spacing)
+                y = margin + row * (frame_height + spacing)
+                frames.append(image.subsurface((x, y, frame_width, frame_height)))
+        return cls(image_path, frames)
+
+    @classmethod
+    def from_atlas(cls, atlas_path: str) -> "SpriteSheet":
+        """
+        Load a texture atlas written by the atlas packer. Frames are named after the packed
+        files' paths relative to the packed directory (e.g. "walk1.png") and indexed in name order.
+
+        Args:
+            atlas_path (str): Path to the atlas JSON file (inside 'assets' folder). Page images are
+                looked up next to it.
+
+        Returns:
+            SpriteSheet: The loaded atlas.
+        """
+        abs_path = os.path.join(os.getcwd(), "assets", atlas_path)
+        if not os.path.exists(abs_path):
+            raise FileNotFoundError(f"User atlas not found: {abs_path}")
+        with open(abs_path, "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+
+        atlas_dir = os.path.dirname(atlas_path)
+        pages = [load_user_image(os.path.join(atlas_dir, page), rle=False) for page in metadata["pages"]]
+
+        frames, names = [], {}
+        for name in sorted(metadata["frames"]):
+            region = metadata["frames"][name]
+            names[name] = len(frames)
+            frames.append(pages[region["page"]].subsurface((region["x"], region["y"], region["w"], region["h"])))
+        return cls(atlas_path, frames, names)
+
+    def get_frame(self, frame: int | str) -> pygame.Surface:
+        """
+        Return a frame by index or name. The Surface is shared and must not be modified.
+
+        Args:
+            frame (int | str): Frame index, or frame name for atlases.
+        """
+        if isinstance(frame, str):
+            if frame not in self.names:
+                raise KeyError(f"Frame '{frame}' not found in sprite sheet {self.image_path}")
+            frame = self.names[frame]
+        return self.frames[frame]
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __repr__(self):
+        return f"<SpriteSheet path='{self.image_path}' frames={len(self.frames)}>"
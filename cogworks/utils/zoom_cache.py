@@ -0,0 +1,130 @@
+import math
+from collections import OrderedDict
+
+import pygame
+
+
+class ZoomCache:
+    """
+    Process-wide cache of images scaled for the camera zoom, keyed by (source surface, target size, filter).
+
+    Scaled images are shared, so users must not modify them, apart from setting their alpha right
+    before each blit. The least recently used images are evicted once more than max_bytes of
+    pixel data are cached.
+
+    With levels_per_octave set, zoom levels are snapped to that many steps per doubling of the
+    zoom (mip-style levels), so a smooth camera zoom reuses a handful of nearby images
+    instead of scaling every sprite again each frame.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, levels_per_octave: int = 0):
+        """
+        Initialise an empty zoom cache.
+
+        Args:
+            max_bytes (int): Pixel data the cache may hold before the least recently used images are evicted.
+            levels_per_octave (int): Zoom steps per doubling of the zoom. 0 uses the exact zoom.
+        """
+        self.max_bytes = max_bytes
+        self.levels_per_octave = levels_per_octave
+        self._images: OrderedDict[tuple, pygame.Surface] = OrderedDict()  # least recently used first
+        self._keys_by_source: dict[pygame.Surface, set[tuple]] = {}
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, max_bytes: int | None = None, levels_per_octave: int | None = None) -> None:
+        """Change the cache settings; arguments left as None keep their value. Cached images are dropped."""
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if levels_per_octave is not None:
+            self.levels_per_octave = levels_per_octave
+        self.clear()
+
+    def quantize(self, zoom: float) -> float:
+        """Return the zoom level to scale images for, snapped when levels_per_octave is set."""
+        if not self.levels_per_octave or zoom <= 0:
+            return zoom
+        levels = self.levels_per_octave
+        return 2.0 ** (round(math.log2(zoom) * levels) / levels)
+
+    def get(self, image: pygame.Surface, size: tuple[int, int], smooth: bool = True) -> pygame.Surface:
+        """
+        Return an image scaled to a size, from the cache when possible.
+
+        Args:
+            image (pygame.Surface): The source image.
+            size (tuple[int, int]): Target width and height. The source itself is returned if it already has this size.
+            smooth (bool): Use smoothscale; otherwise nearest-neighbour scaling (pixel art).
+
+        Returns:
+            pygame.Surface: The shared scaled image.
+        """
+        if image.get_size() == size:
+            return image
+
+        key = (image, size, smooth)
+        scaled = self._images.get(key)
+        if scaled is not None:
+            self.hits += 1
+            self._images.move_to_end(key)
+            return scaled
+
+        self.misses += 1
+        if smooth:
+            source = image
+            if image.get_colorkey() is not None or image.get_bitsize() < 24:
+                source = image.convert_alpha()  # Smoothing would blend the key colour into the edges
+            scaled = pygame.transform.smoothscale(source, size)
+        else:
+            scaled = pygame.transform.scale(image, size)  # Keeps the colour key
+            colorkey = scaled.get_colorkey()
+            if colorkey is not None:
+                scaled.set_colorkey(colorkey, pygame.RLEACCEL)
+        self._images[key] = scaled
+        self._keys_by_source.setdefault(image, set()).add(key)
+        self.bytes += scaled.get_pitch() * scaled.get_height()
+        while self.bytes > self.max_bytes and len(self._images) > 1:
+            self._remove(next(iter(self._images)))
+            self.evictions += 1
+        return scaled
+
+    def discard(self, image: pygame.Surface) -> None:
+        """Drop every scaled copy of a source image that is no longer used."""
+        keys = self._keys_by_source.get(image)
+        if keys:
+            for key in list(keys):
+                self._remove(key)
+
+    def _remove(self, key: tuple):
+        scaled = self._images.pop(key)
+        self.bytes -= scaled.get_pitch() * scaled.get_height()
+        keys = self._keys_by_source[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_source[key[0]]
+
+    def clear(self) -> None:
+        """Drop every cached image."""
+        self._images.clear()
+        self._keys_by_source.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        """Return hit, miss and eviction counts, cached entries and bytes, and the byte cap."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._images),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+
+# Shared by every Sprite
+zoom_cache = ZoomCache()